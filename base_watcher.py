@@ -1,7 +1,10 @@
-import time
+import os
+import signal
 import logging
+import threading
 from pathlib import Path
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,14 +17,33 @@ class BaseWatcher(ABC):
 
     Subclasses implement check_for_updates() to poll an external source
     and create_action_file() to write a task into Needs_Action/.
+
+    Action files for a batch of updates are created concurrently on up to
+    max_workers threads; subclasses guard shared state with self._lock.
     """
 
+    max_workers: int = 4
+
     def __init__(self, vault_path: str, check_interval: int = 60) -> None:
         self.vault_path = Path(vault_path)
         self.needs_action = self.vault_path / "Needs_Action"
         self.needs_action.mkdir(parents=True, exist_ok=True)
         self.check_interval = check_interval
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        # Needs_Action/ as a plain string with trailing separator, so the
+        # write path joins filenames without building Path objects
+        self._needs_action_prefix = os.path.join(str(self.needs_action), "")
+
+        # Directory fd for Needs_Action/ so action files are opened relative
+        # to it (not available on Windows — falls back to full paths)
+        self._needs_action_fd: int | None = None
+        if os.open in os.supports_dir_fd:
+            self._needs_action_fd = os.open(
+                self.needs_action, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+            )
 
     @abstractmethod
     def check_for_updates(self) -> list:
@@ -34,6 +56,105 @@ class BaseWatcher(ABC):
         Returns the Path of the created file.
         """
 
+    def flush(self) -> None:
+        """Persist any state buffered while creating a batch of action files.
+
+        Called once after every batch.  The default does nothing.
+        """
+
+    def stop(self) -> None:
+        """Ask run() to exit; wakes it immediately if it is waiting."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Release resources held by the watcher.  Called on shutdown."""
+        if self._needs_action_fd is not None:
+            os.close(self._needs_action_fd)
+            self._needs_action_fd = None
+
+    def write_action_file(self, filename: str, content: str) -> Path:
+        """Write *content* to Needs_Action/*filename* and return its Path.
+
+        Encodes once and issues a single open/write/fsync/close on the raw
+        fd of a per-thread temp file, then renames it into place — two
+        writers of the same name can never interleave, and readers never
+        see a partial file.  Paths are handled as strings; a Path is only
+        built for the result.
+        """
+        data = memoryview(content.encode("utf-8"))
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        tmp = f".{filename}.{threading.get_ident()}.tmp"
+        dir_fd = self._needs_action_fd
+        if dir_fd is not None:
+            fd = os.open(tmp, flags, 0o644, dir_fd=dir_fd)
+        else:
+            tmp = self._needs_action_prefix + tmp
+            fd = os.open(tmp, flags, 0o644)
+        try:
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if dir_fd is not None:
+                os.replace(tmp, filename, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+            else:
+                os.replace(tmp, self._needs_action_prefix + filename)
+        except BaseException:
+            try:
+                os.unlink(tmp, dir_fd=dir_fd)
+            except OSError:
+                pass
+            raise
+        return Path(self._needs_action_prefix + filename)
+
+    def _create_action_files(self, updates: list) -> None:
+        """Create action files for *updates* concurrently on a thread pool."""
+        workers = max(1, min(self.max_workers, len(updates)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.create_action_file, item) for item in updates]
+            for future in as_completed(futures):
+                try:
+                    path = future.result()
+                except Exception:
+                    self.logger.exception("Failed to create action file")
+                    continue
+                self.logger.info("Created action file: %s", path.name)
+
+    def _sync_action_files(self) -> None:
+        """Make a whole batch of new action files durable.
+
+        Each file's data is fsynced as it is written; this fsyncs the
+        Needs_Action/ directory once so the new entries survive a crash too.
+        Runs before flush() so an ID is never recorded as processed while
+        its action file could still be lost.  Directories cannot be opened
+        for fsync on Windows, where this is a no-op.
+        """
+        if self._needs_action_fd is not None:
+            os.fsync(self._needs_action_fd)
+            return
+        try:
+            fd = os.open(self.needs_action, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def handle_updates(self, updates: list) -> None:
+        """Create action files for a batch of updates and persist state.
+
+        Shared by the polling loop and any push-based delivery path.
+        """
+        self.logger.info("Found %d new item(s)", len(updates))
+        self._create_action_files(updates)
+        self._sync_action_files()
+        self.flush()
+
     def run(self) -> None:
         """Infinite polling loop with error handling and graceful shutdown."""
         self.logger.info(
@@ -41,15 +162,16 @@ class BaseWatcher(ABC):
             self.__class__.__name__,
             self.check_interval,
         )
+        # SIGTERM (e.g. docker stop) ends the loop like Ctrl+C does; handlers
+        # can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
         try:
-            while True:
+            while not self._stop.is_set():
                 try:
                     updates = self.check_for_updates()
                     if updates:
-                        self.logger.info("Found %d new item(s)", len(updates))
-                        for item in updates:
-                            path = self.create_action_file(item)
-                            self.logger.info("Created action file: %s", path.name)
+                        self.handle_updates(updates)
                     else:
                         self.logger.debug("No new updates")
                 except KeyboardInterrupt:
@@ -57,6 +179,9 @@ class BaseWatcher(ABC):
                 except Exception:
                     self.logger.exception("Error during update check")
 
-                time.sleep(self.check_interval)
+                self._stop.wait(self.check_interval)
         except KeyboardInterrupt:
+            pass
+        finally:
             self.logger.info("Shutting down %s gracefully", self.__class__.__name__)
+            self.close()
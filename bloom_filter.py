@@ -0,0 +1,130 @@
+"""BloomFilter — compact, fixed-size set membership for processed IDs.
+
+Used by the watchers to remember which message/event IDs have already
+been turned into action files without keeping every ID in memory.
+
+A Bloom filter never reports a false negative (an added ID is always
+found) but may report a false positive at roughly ``error_rate``.  For
+the watchers that means, at worst, one item in ``1 / error_rate`` is
+skipped — never processed twice.
+
+Filters loaded from disk are memory-mapped: loading is O(1), pages are
+read on demand, and save() only has to write back the dirty pages.
+
+No extra dependencies — uses only the Python standard library.
+"""
+
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# File header: magic, number of bits, number of hash functions, items added
+_HEADER = struct.Struct("<4sQIQ")
+_MAGIC = b"BLM1"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter backed by a bytearray."""
+
+    def __init__(self, capacity: int = 250_000, error_rate: float = 1e-6) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        self._mm: mmap.mmap | None = None
+        self._path: Path | None = None
+
+    # ------------------------------------------------------------------
+    # Set-like interface
+    # ------------------------------------------------------------------
+
+    def _positions(self, key: str):
+        """Yield the bit positions for *key* using double hashing."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        """Add *key* to the filter."""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+        if self.count == self.capacity + 1:
+            logger.warning(
+                "Bloom filter exceeded its capacity of %d — "
+                "false-positive rate will rise above %g",
+                self.capacity,
+                self.error_rate,
+            )
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        """Write the filter to *path*.
+
+        A filter mapped from *path* is synced in place: bits are only ever
+        set, so a torn write can never lose an ID that was saved before.
+        Otherwise the file is written atomically (temp file + rename).
+        """
+        if self._mm is not None and Path(path) == self._path:
+            self._mm[:_HEADER.size] = self._header()
+            self._mm.flush()
+            return
+
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(self._header())
+            f.write(self.bits)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _header(self) -> bytes:
+        return _HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.count)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        """Memory-map a filter previously written by save()."""
+        with open(path, "r+b") as f:
+            mm = mmap.mmap(f.fileno(), 0)
+        magic, num_bits, num_hashes, count = _HEADER.unpack_from(mm)
+        if magic != _MAGIC:
+            mm.close()
+            raise ValueError(f"Not a Bloom filter file: {path}")
+
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom.bits = memoryview(mm)[_HEADER.size:]
+        bloom._mm = mm
+        bloom._path = Path(path)
+        # Recover the sizing parameters for capacity warnings
+        bloom.capacity = max(1, round(num_bits * math.log(2) / num_hashes))
+        bloom.error_rate = math.exp(-num_bits / bloom.capacity * math.log(2) ** 2)
+        return bloom
+
+    def close(self) -> None:
+        """Unmap a filter opened by load().  Call save() first to keep changes."""
+        if self._mm is not None:
+            self.bits.release()
+            self._mm.close()
+            self._mm = None
@@ -5,7 +5,12 @@ Inherits from BaseWatcher.  Requires a Google OAuth credentials file
 """
 
 import datetime
+import hashlib
 import logging
+import os
+import re
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 
 from google.auth.transport.requests import Request
@@ -14,6 +19,7 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
 from base_watcher import BaseWatcher
+from bloom_filter import BloomFilter
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +28,90 @@ SCOPES = [
     "https://www.googleapis.com/auth/gmail.send",
 ]
 
+# Gmail rejects batch requests with more than 100 calls
+BATCH_SIZE = 100
+
+# Only these headers are read from each message
+METADATA_HEADERS = ["From", "Subject"]
+
+# Gmail push watches expire after 7 days; renew well before that
+WATCH_RENEW_SECONDS = 24 * 3600
+
+# Days an email's content counts as already filed.  Digests are stored with
+# the day they were filed, so repeat alerts (e.g. "Payment failed") are filed
+# again once the window has passed
+CONTENT_DEDUP_DAYS = 3
+DIGEST_DAY_FORMAT = "@%Y%m%d"
+
+# Action file layout — filled once per email with str.format
+EMAIL_TEMPLATE = (
+    "---\n"
+    "type: email\n"
+    "from: \"{sender}\"\n"
+    "subject: \"{subject}\"\n"
+    "received: {received}\n"
+    "priority: high\n"
+    "status: pending\n"
+    "---\n"
+    "\n"
+    "## Email Content\n"
+    "\n"
+    "**From:** {sender}\n"
+    "**Subject:** {subject}\n"
+    "\n"
+    "> {snippet}\n"
+    "\n"
+    "## Suggested Actions\n"
+    "\n"
+    "{suggestions}"
+)
+
+# Keyword groups used to suggest actions for an email
+URGENT_KEYWORDS = frozenset({"urgent", "asap", "immediately", "critical", "emergency"})
+PAYMENT_KEYWORDS = frozenset({"invoice", "payment", "pay", "billing", "receipt", "charge"})
+MEETING_KEYWORDS = frozenset({"meeting", "calendar", "schedule", "call", "zoom", "teams"})
+REPLY_KEYWORDS = frozenset({"reply", "respond", "confirm", "rsvp", "feedback", "question"})
+
+# Keyword groups as bit flags, in the order their actions are listed
+URGENT, PAYMENT, MEETING, REPLY = 1, 2, 4, 8
+
+# Keyword -> group flag, matched in a single pass over the email text
+KEYWORD_GROUPS = {
+    **dict.fromkeys(URGENT_KEYWORDS, URGENT),
+    **dict.fromkeys(PAYMENT_KEYWORDS, PAYMENT),
+    **dict.fromkeys(MEETING_KEYWORDS, MEETING),
+    **dict.fromkeys(REPLY_KEYWORDS, REPLY),
+}
+KEYWORD_RE = re.compile(r"\b(?:" + "|".join(sorted(KEYWORD_GROUPS)) + r")\b")
+
+GROUP_ACTIONS = (
+    (URGENT, "- [ ] **URGENT** — Escalate and respond immediately"),
+    (PAYMENT, "- [ ] Review financial details and create Pending_Approval file"),
+    (MEETING, "- [ ] Check calendar and confirm availability"),
+    (REPLY, "- [ ] Draft and send reply"),
+)
+
+# Always included, after any group-specific actions
+BASELINE_ACTIONS = (
+    "- [ ] Read full email",
+    "- [ ] Decide on response or next step",
+    "- [ ] Log decision in Logs/",
+)
+
+# Suggested-actions text for every combination of group flags
+SUGGESTIONS = tuple(
+    "\n".join(
+        [action for flag, action in GROUP_ACTIONS if mask & flag] + list(BASELINE_ACTIONS)
+    ) + "\n"
+    for mask in range(16)
+)
+
 
 class GmailWatcher(BaseWatcher):
     """Watch a Gmail inbox for unread important messages."""
 
+    max_workers = 10
+
     def __init__(
         self,
         vault_path: str,
@@ -37,7 +123,15 @@ class GmailWatcher(BaseWatcher):
         self.credentials_path = Path(credentials_path)
         self.token_path = self.vault_path / "token.json"
         self.processed_ids_path = self.vault_path / "processed_gmail_ids.txt"
-        self.processed_ids: set[str] = self._load_processed_ids()
+        self.bloom_path = self.vault_path / "processed_gmail_ids.bloom"
+        self.digests_path = self.vault_path / "processed_gmail_digests.bloom"
+        self.processed_ids: BloomFilter
+        self.processed_digests: BloomFilter
+        self.processed_ids, self.processed_digests = self._load_processed_ids()
+        self._ids_fp = self.processed_ids_path.open(
+            "a", buffering=1 << 16, encoding="utf-8"
+        )
+        self._check_lock = threading.Lock()
         self.service = self._build_service()
 
     # ------------------------------------------------------------------
@@ -78,23 +172,63 @@ class GmailWatcher(BaseWatcher):
     # Processed-ID persistence
     # ------------------------------------------------------------------
 
-    def _load_processed_ids(self) -> set[str]:
-        """Load previously processed message IDs from disk."""
-        if self.processed_ids_path.exists():
-            ids = {
-                line.strip()
-                for line in self.processed_ids_path.read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            }
+    def _load_processed_ids(self) -> tuple[BloomFilter, BloomFilter]:
+        """Load the Bloom filters of processed message IDs and content digests.
+
+        The text file is kept as an append-only audit trail of
+        ``<message id>\t<content digest>@<day filed>`` lines; it is only read
+        once, to seed the filters when no .bloom files exist yet.
+        """
+        if self.bloom_path.exists() and self.digests_path.exists():
+            ids = BloomFilter.load(self.bloom_path)
+            digests = BloomFilter.load(self.digests_path)
             self.logger.info("Loaded %d processed message IDs", len(ids))
-            return ids
-        return set()
+            return ids, digests
 
-    def _save_processed_id(self, message_id: str) -> None:
-        """Append a single ID to the processed-IDs file and the in-memory set."""
-        self.processed_ids.add(message_id)
-        with self.processed_ids_path.open("a", encoding="utf-8") as f:
-            f.write(message_id + "\n")
+        ids, digests = BloomFilter(), BloomFilter()
+        if self.processed_ids_path.exists():
+            with self.processed_ids_path.open(encoding="utf-8") as f:
+                for line in f:
+                    fields = line.split()
+                    if not fields:
+                        continue
+                    ids.add(fields[0])
+                    if len(fields) > 1:
+                        digests.add(fields[1])
+            ids.save(self.bloom_path)
+            digests.save(self.digests_path)
+            self.logger.info("Seeded Bloom filter with %d processed message IDs", len(ids))
+        return ids, digests
+
+    def _save_processed_id(self, message_id: str, digest: str | None = None) -> None:
+        """Record an ID (and its content digest) in the Bloom filters and ID file.
+
+        The write is made durable by flush() at the end of each batch.
+        """
+        with self._lock:
+            self.processed_ids.add(message_id)
+            if digest is None:
+                self._ids_fp.write(message_id + "\n")
+            else:
+                self.processed_digests.add(digest)
+                self._ids_fp.write(f"{message_id}\t{digest}\n")
+
+    def flush(self) -> None:
+        """Flush buffered processed IDs to disk and fsync once per batch."""
+        with self._lock:
+            self._ids_fp.flush()
+            os.fsync(self._ids_fp.fileno())
+            self.processed_ids.save(self.bloom_path)
+            self.processed_digests.save(self.digests_path)
+
+    def close(self) -> None:
+        """Flush and close the processed-IDs file and Bloom filters."""
+        if not self._ids_fp.closed:
+            self.flush()
+            self._ids_fp.close()
+            self.processed_ids.close()
+            self.processed_digests.close()
+        super().close()
 
     # ------------------------------------------------------------------
     # BaseWatcher interface
@@ -127,95 +261,243 @@ class GmailWatcher(BaseWatcher):
                 len(new_messages),
                 len(messages),
             )
+            self._fetch_messages(new_messages)
+            new_messages = self._drop_duplicate_content(self._refetch_missing(new_messages))
         return new_messages
 
     def create_action_file(self, item) -> Path:
-        """Fetch the full message, extract headers, and write an action file."""
+        """Extract headers from the fetched message and write an action file."""
         message_id: str = item["id"]
 
-        try:
-            msg = (
-                self.service.users()
-                .messages()
-                .get(userId="me", id=message_id, format="full")
-                .execute()
-            )
-        except Exception:
-            self.logger.exception("Failed to fetch message %s", message_id)
-            raise
-
-        headers = {h["name"]: h["value"] for h in msg["payload"].get("headers", [])}
-        sender = headers.get("From", "Unknown")
-        subject = headers.get("Subject", "(no subject)")
-        snippet = msg.get("snippet", "")
+        sender, subject, snippet = self._message_fields(item["message"])
         received = datetime.datetime.now().isoformat()
 
         # Determine suggested actions based on content
         suggestions = self._suggest_actions(subject, snippet)
 
-        content = (
-            f"---\n"
-            f"type: email\n"
-            f"from: \"{sender}\"\n"
-            f"subject: \"{subject}\"\n"
-            f"received: {received}\n"
-            f"priority: high\n"
-            f"status: pending\n"
-            f"---\n"
-            f"\n"
-            f"## Email Content\n"
-            f"\n"
-            f"**From:** {sender}\n"
-            f"**Subject:** {subject}\n"
-            f"\n"
-            f"> {snippet}\n"
-            f"\n"
-            f"## Suggested Actions\n"
-            f"\n"
-            f"{suggestions}"
+        content = EMAIL_TEMPLATE.format(
+            sender=sender,
+            subject=subject,
+            received=received,
+            snippet=snippet,
+            suggestions=suggestions,
         )
 
         filename = f"EMAIL_{message_id}.md"
-        filepath = self.needs_action / filename
-        filepath.write_text(content, encoding="utf-8")
+        filepath = self.write_action_file(filename, content)
 
-        self._save_processed_id(message_id)
+        digest = self._content_digest(sender, subject, snippet)
+        self._save_processed_id(
+            message_id, digest + datetime.date.today().strftime(DIGEST_DAY_FORMAT)
+        )
         self.logger.info("Action file created: %s (subject: %s)", filename, subject)
         return filepath
 
     # ------------------------------------------------------------------
-    # Helpers
+    # Push delivery (Gmail users.watch + Cloud Pub/Sub)
+    # ------------------------------------------------------------------
+
+    def run_pushed(self, topic_name: str, subscription_path: str) -> None:
+        """Event-driven alternative to run(): react to Gmail push notifications.
+
+        Gmail publishes a notification to *topic_name* whenever the mailbox
+        changes; each one received on *subscription_path* triggers a single
+        check_for_updates() pass.  Requires google-cloud-pubsub.
+        """
+        from google.cloud import pubsub_v1
+
+        self._start_watch(topic_name)
+        subscriber = pubsub_v1.SubscriberClient()
+
+        def _on_notification(message) -> None:
+            message.ack()
+            self._check_once()
+
+        future = subscriber.subscribe(subscription_path, callback=_on_notification)
+        self.logger.info("Listening for Gmail push notifications on %s", subscription_path)
+
+        # Catch up on anything that arrived before the watch was registered
+        self._check_once()
+
+        try:
+            while True:
+                try:
+                    future.result(timeout=WATCH_RENEW_SECONDS)
+                except FutureTimeoutError:
+                    self._start_watch(topic_name)
+        except KeyboardInterrupt:
+            self.logger.info("Shutting down %s gracefully", self.__class__.__name__)
+        finally:
+            future.cancel()
+            subscriber.close()
+            self.close()
+
+    def _check_once(self) -> None:
+        """Run a single check/handle pass.
+
+        Pub/Sub delivers notifications on a thread pool, so passes are
+        serialised to avoid filing the same message twice.
+        """
+        with self._check_lock:
+            try:
+                updates = self.check_for_updates()
+                if updates:
+                    self.handle_updates(updates)
+            except Exception:
+                self.logger.exception("Error handling Gmail push notification")
+
+    def _start_watch(self, topic_name: str) -> None:
+        """Register (or renew) the Gmail push watch on the inbox."""
+        response = (
+            self.service.users()
+            .watch(userId="me", body={"topicName": topic_name, "labelIds": ["INBOX"]})
+            .execute()
+        )
+        self.logger.info(
+            "Gmail push watch active on %s (expires %s)",
+            topic_name,
+            response.get("expiration", "unknown"),
+        )
+
+    # ------------------------------------------------------------------
+    # Content de-duplication
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _suggest_actions(subject: str, snippet: str) -> str:
-        """Generate a checklist of suggested actions based on email content."""
-        text = f"{subject} {snippet}".lower()
-        actions: list[str] = []
+    def _message_fields(msg: dict) -> tuple[str, str, str]:
+        """Return (sender, subject, snippet) for a fetched message."""
+        headers = {h["name"]: h["value"] for h in msg["payload"].get("headers", [])}
+        return (
+            headers.get("From", "Unknown"),
+            headers.get("Subject", "(no subject)"),
+            msg.get("snippet", ""),
+        )
 
-        urgent_keywords = {"urgent", "asap", "immediately", "critical", "emergency"}
-        payment_keywords = {"invoice", "payment", "pay", "billing", "receipt", "charge"}
-        meeting_keywords = {"meeting", "calendar", "schedule", "call", "zoom", "teams"}
-        reply_keywords = {"reply", "respond", "confirm", "rsvp", "feedback", "question"}
+    @staticmethod
+    def _content_digest(sender: str, subject: str, snippet: str) -> str:
+        """Return a short hash identifying an email by its visible content."""
+        key = f"{sender}\x00{subject}\x00{snippet}".encode("utf-8")
+        return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+    def _drop_duplicate_content(self, items: list) -> list:
+        """Filter out messages whose content was filed in the last
+        CONTENT_DEDUP_DAYS days.
+
+        Gmail can surface the same email again under a new message ID
+        (e.g. when a thread is re-marked unread).  Those are recorded as
+        processed, so they are not fetched again, but get no action file.
+        Their digest is not recorded, so the window runs from the last
+        email actually filed.
+        """
+        today = datetime.date.today()
+        days = [
+            (today - datetime.timedelta(days=n)).strftime(DIGEST_DAY_FORMAT)
+            for n in range(CONTENT_DEDUP_DAYS)
+        ]
+        fresh, seen, skipped = [], set(), 0
+        for item in items:
+            digest = self._content_digest(*self._message_fields(item["message"]))
+            if digest in seen or any(digest + day in self.processed_digests for day in days):
+                self.logger.info(
+                    "Skipped message %s: same content filed in the last %d days",
+                    item["id"],
+                    CONTENT_DEDUP_DAYS,
+                )
+                self._save_processed_id(item["id"])
+                skipped += 1
+                continue
+            seen.add(digest)
+            fresh.append(item)
 
-        if urgent_keywords & set(text.split()):
-            actions.append("- [ ] **URGENT** — Escalate and respond immediately")
+        if skipped:
+            self.flush()
+        return fresh
 
-        if payment_keywords & set(text.split()):
-            actions.append("- [ ] Review financial details and create Pending_Approval file")
+    # ------------------------------------------------------------------
+    # Message fetching
+    # ------------------------------------------------------------------
+
+    def _fetch_messages(self, items: list) -> None:
+        """Fetch message metadata for *items* in batch requests.
 
-        if meeting_keywords & set(text.split()):
-            actions.append("- [ ] Check calendar and confirm availability")
+        Each fetched message is stored on its item under the "message" key.
+        Items whose fetch failed are left untouched for _refetch_missing().
+        """
+        by_id = {m["id"]: m for m in items}
 
-        if reply_keywords & set(text.split()):
-            actions.append("- [ ] Draft and send reply")
+        def _collect(request_id, response, exception) -> None:
+            if exception is not None:
+                self.logger.error(
+                    "Batch fetch failed for message %s: %s", request_id, exception
+                )
+                return
+            by_id[request_id]["message"] = response
+
+        for start in range(0, len(items), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for m in items[start:start + BATCH_SIZE]:
+                batch.add(
+                    self.service.users()
+                    .messages()
+                    .get(
+                        userId="me",
+                        id=m["id"],
+                        format="metadata",
+                        metadataHeaders=METADATA_HEADERS,
+                    ),
+                    request_id=m["id"],
+                )
+            try:
+                batch.execute()
+            except Exception:
+                self.logger.exception("Batch fetch of Gmail messages failed")
+
+    def _refetch_missing(self, items: list) -> list:
+        """Fetch, one at a time, the items the batch request missed.
+
+        Runs on the calling thread: the service's Http object is not
+        thread-safe, so the action-file pool never touches the network.
+        Items that still fail are dropped and retried on the next check.
+        """
+        fetched = []
+        for item in items:
+            if "message" not in item:
+                try:
+                    item["message"] = self._fetch_message(item["id"])
+                except Exception:
+                    continue
+            fetched.append(item)
+        return fetched
+
+    def _fetch_message(self, message_id: str) -> dict:
+        """Fetch a single message's metadata (fallback when the batch missed it)."""
+        try:
+            return (
+                self.service.users()
+                .messages()
+                .get(
+                    userId="me",
+                    id=message_id,
+                    format="metadata",
+                    metadataHeaders=METADATA_HEADERS,
+                )
+                .execute()
+            )
+        except Exception:
+            self.logger.exception("Failed to fetch message %s", message_id)
+            raise
 
-        # Always include these baseline actions
-        actions.append("- [ ] Read full email")
-        actions.append("- [ ] Decide on response or next step")
-        actions.append("- [ ] Log decision in Logs/")
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
 
-        return "\n".join(actions) + "\n"
+    @staticmethod
+    def _suggest_actions(subject: str, snippet: str) -> str:
+        """Generate a checklist of suggested actions based on email content."""
+        mask = 0
+        for word in KEYWORD_RE.findall(f"{subject} {snippet}".lower()):
+            mask |= KEYWORD_GROUPS[word]
+        return SUGGESTIONS[mask]
 
 
 # ======================================================================
@@ -225,11 +507,21 @@ class GmailWatcher(BaseWatcher):
 if __name__ == "__main__":
     import sys
 
-    vault = sys.argv[1] if len(sys.argv) > 1 else "."
-    creds = sys.argv[2] if len(sys.argv) > 2 else "credentials.json"
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    vault = args[0] if len(args) > 0 else "."
+    creds = args[1] if len(args) > 1 else "credentials.json"
 
     watcher = GmailWatcher(vault_path=vault, credentials_path=creds)
-    watcher.run()
+
+    # Push mode: python gmail_watcher.py VAULT CREDS --push
+    # (needs GMAIL_PUBSUB_TOPIC and GMAIL_PUBSUB_SUBSCRIPTION — see setup step 8)
+    if "--push" in sys.argv:
+        watcher.run_pushed(
+            topic_name=os.environ["GMAIL_PUBSUB_TOPIC"],
+            subscription_path=os.environ["GMAIL_PUBSUB_SUBSCRIPTION"],
+        )
+    else:
+        watcher.run()
 
 
 # ======================================================================
@@ -281,6 +573,21 @@ if __name__ == "__main__":
 #    - This watcher uses gmail.readonly — it can never send, delete,
 #      or modify any email. Read-only access for safety.
 #
+# 8. PUSH MODE (optional, instead of polling)
+#    - pip install google-cloud-pubsub
+#    - In Cloud Console → Pub/Sub, create a topic (e.g. "gmail-inbox")
+#      and a pull subscription on it (e.g. "gmail-inbox-sub").
+#    - Grant gmail-api-push@system.gserviceaccount.com the
+#      "Pub/Sub Publisher" role on the topic.
+#    - Authenticate the Pub/Sub client with Application Default
+#      Credentials:  gcloud auth application-default login
+#    - Run:
+#        export GMAIL_PUBSUB_TOPIC="projects/<project>/topics/gmail-inbox"
+#        export GMAIL_PUBSUB_SUBSCRIPTION="projects/<project>/subscriptions/gmail-inbox-sub"
+#        python gmail_watcher.py /path/to/vault credentials.json --push
+#    - New mail is picked up within about a second instead of on the
+#      next poll.  The watch is renewed daily (Gmail expires it after 7 days).
+#
 # TROUBLESHOOTING
 #    - "Access blocked: This app's request is invalid"
 #      → Make sure your email is listed under Test Users in the
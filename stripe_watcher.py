@@ -6,6 +6,7 @@ Inherits from BaseWatcher.
 REQUIREMENTS
 ------------
     pip install stripe
+    pip install orjson      # optional — faster parsing of API responses
 
 ENVIRONMENT
 -----------
@@ -21,26 +22,107 @@ ENVIRONMENT
         set STRIPE_SECRET_KEY=sk_live_...
 """
 
+import json
 import logging
 import os
 import sys
 import time
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
 import stripe
 
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
 from base_watcher import BaseWatcher
+from bloom_filter import BloomFilter
 
 logger = logging.getLogger(__name__)
 
 # High-value threshold in cents ($500.00)
 HIGH_VALUE_THRESHOLD_CENTS = 50_000
 
+# Action file layout — filled once per payment with str.format
+PAYMENT_TEMPLATE = (
+    "---\n"
+    "type: stripe_payment\n"
+    "amount: {amount_display} {currency}\n"
+    "customer: \"{customer_label}\"\n"
+    "received: {received}\n"
+    "priority: {priority}\n"
+    "status: succeeded\n"
+    "charge_id: {charge_id}\n"
+    "event_id: {event_id}\n"
+    "---\n"
+    "\n"
+    "## Payment Details\n"
+    "\n"
+    "**Amount:** {amount_display} {currency}\n"
+    "**Customer:** {customer_label}\n"
+    "**Description:** {description}\n"
+    "**Charge ID:** `{charge_id}`\n"
+    "**Received:** {received}\n"
+    "\n"
+    "## Suggested Actions\n"
+    "\n"
+    "{suggestions}"
+)
+
+# Stripe's maximum page size — fewer serial round trips per poll
+EVENTS_PAGE_SIZE = 100
+
+# Checks an event may fail to be filed before the cursor moves past it
+MAX_EVENT_ATTEMPTS = 5
+
+# Event types turned into action files (polling and webhook)
+EVENT_TYPES = [
+    "charge.succeeded",
+    "payment_intent.succeeded",
+]
+
+
+# ----------------------------------------------------------------------
+# Optional fast JSON
+# ----------------------------------------------------------------------
+
+def _fast_loads(data, **kwargs):
+    """json.loads stand-in backed by orjson; keyword hooks use the stdlib."""
+    if kwargs:
+        return json.loads(data, **kwargs)
+    return orjson.loads(data)
+
+
+def _use_orjson() -> None:
+    """Point stripe-python's response and webhook parsing at orjson.
+
+    Only the ``json`` name inside those stripe modules is replaced — the
+    stdlib module itself is left untouched.  Serialisation keeps using
+    json.dumps, which stripe calls with formatting options orjson lacks.
+    """
+    if orjson is None:
+        return
+    fast_json = type(json)("stripe_fast_json")
+    fast_json.__dict__.update(json.__dict__)
+    fast_json.loads = _fast_loads
+    for name in ("stripe._api_requestor", "stripe._webhook"):
+        module = sys.modules.get(name)
+        if module is not None and getattr(module, "json", None) is json:
+            module.json = fast_json
+            logger.debug("Using orjson for %s", name)
+
+
+_use_orjson()
+
 
 class StripeWatcher(BaseWatcher):
     """Watch Stripe for successful charges and payment intents."""
 
+    max_workers = 5
+
     def __init__(
         self,
         vault_path: str,
@@ -68,7 +150,18 @@ class StripeWatcher(BaseWatcher):
         # ---- State ----
         self.last_checked: float = time.time() - 3600  # start 1 hour back
         self.processed_ids_path = self.vault_path / "processed_stripe_ids.txt"
-        self.processed_ids: set[str] = self._load_processed_ids()
+        self.bloom_path = self.vault_path / "processed_stripe_ids.bloom"
+        self.cursor_path = self.vault_path / "stripe_last_event_id.txt"
+        self.last_event_id: str | None = self._load_cursor()
+        # Events from the last listing, oldest first — the cursor only moves
+        # past those that have action files (see _advance_cursor)
+        self._listed: list = []
+        # Event ID -> checks it has failed to be filed in
+        self._failures: dict[str, int] = {}
+        self.processed_ids: BloomFilter = self._load_processed_ids()
+        self._ids_fp = self.processed_ids_path.open(
+            "a", buffering=1 << 16, encoding="utf-8"
+        )
 
         self.logger.info(
             "StripeWatcher initialised — polling every %ds, "
@@ -81,46 +174,134 @@ class StripeWatcher(BaseWatcher):
     # Processed-ID persistence
     # ------------------------------------------------------------------
 
-    def _load_processed_ids(self) -> set[str]:
-        """Load previously processed event/charge IDs from disk."""
+    def _load_processed_ids(self) -> BloomFilter:
+        """Load the Bloom filter of previously processed event/charge IDs.
+
+        The text file is kept as an append-only audit trail; it is only
+        read once, to seed the filter when no .bloom file exists yet.
+        """
+        if self.bloom_path.exists():
+            bloom = BloomFilter.load(self.bloom_path)
+            self.logger.info("Loaded %d processed Stripe IDs", len(bloom))
+            return bloom
+
+        bloom = BloomFilter()
         if self.processed_ids_path.exists():
-            ids = {
-                line.strip()
-                for line in self.processed_ids_path.read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            }
-            self.logger.info("Loaded %d processed Stripe IDs", len(ids))
-            return ids
-        return set()
+            with self.processed_ids_path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        bloom.add(line.strip())
+            bloom.save(self.bloom_path)
+            self.logger.info("Seeded Bloom filter with %d processed Stripe IDs", len(bloom))
+        return bloom
 
     def _save_processed_id(self, event_id: str) -> None:
-        """Append a single ID to the processed-IDs file and in-memory set."""
-        self.processed_ids.add(event_id)
-        with self.processed_ids_path.open("a", encoding="utf-8") as f:
-            f.write(event_id + "\n")
+        """Record a single ID in the Bloom filter and the buffered ID file.
+
+        The write is made durable by flush() at the end of each batch.
+        """
+        with self._lock:
+            self.processed_ids.add(event_id)
+            self._ids_fp.write(event_id + "\n")
+
+    def _load_cursor(self) -> str | None:
+        """Return the newest event ID seen by a previous run, if any."""
+        try:
+            return self.cursor_path.read_bytes().decode("utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _is_filed(self, event) -> bool:
+        """True if *event*, or another event for the same charge, was filed."""
+        return (
+            event.id in self.processed_ids
+            or self._event_charge_id(event) in self.processed_ids
+        )
+
+    def _advance_cursor(self) -> None:
+        """Move last_event_id forward over the listed events that are
+        processed, stopping at the first one whose action file failed, so
+        that event is listed again on the next check.
+
+        An event that has failed MAX_EVENT_ATTEMPTS checks is given up on,
+        so it cannot pin the cursor forever.
+        """
+        for event in self._listed:
+            if not self._is_filed(event):
+                failures = self._failures.get(event.id, 0) + 1
+                if failures < MAX_EVENT_ATTEMPTS:
+                    self._failures[event.id] = failures
+                    break
+                self.logger.error(
+                    "Giving up on Stripe event %s after %d failed attempts",
+                    event.id,
+                    failures,
+                )
+            self._failures.pop(event.id, None)
+            self.last_event_id = event.id
+        self._listed = []
+
+    def _save_cursor(self) -> None:
+        """Persist last_event_id atomically (temp file + rename)."""
+        if self.last_event_id is None:
+            return
+        tmp = self.cursor_path.with_name(self.cursor_path.name + ".tmp")
+        tmp.write_bytes(f"{self.last_event_id}\n".encode("utf-8"))
+        os.replace(tmp, self.cursor_path)
+
+    def flush(self) -> None:
+        """Flush buffered processed IDs to disk and fsync once per batch."""
+        with self._lock:
+            self._ids_fp.flush()
+            os.fsync(self._ids_fp.fileno())
+            self.processed_ids.save(self.bloom_path)
+            self._advance_cursor()
+            self._save_cursor()
+
+    def close(self) -> None:
+        """Flush and close the processed-IDs file and Bloom filters."""
+        if not self._ids_fp.closed:
+            self.flush()
+            self._ids_fp.close()
+            self.processed_ids.close()
+        super().close()
 
     # ------------------------------------------------------------------
     # BaseWatcher interface
     # ------------------------------------------------------------------
 
     def check_for_updates(self) -> list:
-        """Fetch recent successful charge/payment events from Stripe."""
-        cutoff = int(self.last_checked - 60)  # 60s overlap to avoid missed events
-
-        self.logger.debug(
-            "Checking Stripe events since %s",
-            datetime.fromtimestamp(cutoff, tz=timezone.utc).isoformat(),
-        )
+        """Fetch successful charge/payment events newer than the last one seen.
+
+        Once an event has been seen, only strictly newer events are listed
+        (``ending_before`` cursor).  The ``created`` time window is only
+        used on a cold start, before any cursor exists.
+        """
+        params = {"types": EVENT_TYPES, "limit": EVENTS_PAGE_SIZE}
+        if self.last_event_id:
+            params["ending_before"] = self.last_event_id
+            self.logger.debug("Checking Stripe events after %s", self.last_event_id)
+        else:
+            cutoff = int(self.last_checked - 60)  # 60s overlap to avoid missed events
+            params["created"] = {"gt": cutoff}
+            self.logger.debug(
+                "Checking Stripe events since %s",
+                datetime.fromtimestamp(cutoff, tz=timezone.utc).isoformat(),
+            )
 
         try:
-            events = stripe.Event.list(
-                types=[
-                    "charge.succeeded",
-                    "payment_intent.succeeded",
-                ],
-                created={"gt": cutoff},
-                limit=20,
+            events = list(stripe.Event.list(**params).auto_paging_iter())
+        except stripe.error.InvalidRequestError:
+            if not self.last_event_id:
+                self.logger.exception("Stripe API error")
+                return []
+            # The cursor event is no longer retrievable (Stripe keeps 30 days)
+            self.logger.warning(
+                "Stripe rejected cursor %s — falling back to time window",
+                self.last_event_id,
             )
+            self.last_event_id = None
+            return []
         except stripe.error.AuthenticationError:
             self.logger.error(
                 "Stripe authentication failed — check STRIPE_SECRET_KEY"
@@ -140,7 +321,27 @@ class StripeWatcher(BaseWatcher):
             self.logger.exception("Stripe API error")
             return []
 
-        new_events = [e for e in events.auto_paging_iter() if e.id not in self.processed_ids]
+        # Stripe lists newest first; reversing keeps events created in the
+        # same second in order, which sorting by ``created`` would not
+        self._listed = list(reversed(events))
+
+        # charge.succeeded and payment_intent.succeeded for one payment share
+        # an action file: file only the oldest event per charge, and skip any
+        # whose charge was already filed by an earlier event
+        new_events, charge_ids = [], set()
+        for event in self._listed:
+            charge_id = self._event_charge_id(event)
+            if (
+                event.id in self.processed_ids
+                or charge_id in self.processed_ids
+                or charge_id in charge_ids
+            ):
+                continue
+            charge_ids.add(charge_id)
+            new_events.append(event)
+        if not new_events:
+            # Everything listed was filed before — nothing can fail
+            self._advance_cursor()
 
         if new_events:
             self.logger.info(
@@ -173,37 +374,25 @@ class StripeWatcher(BaseWatcher):
         priority = "high" if amount_cents > HIGH_VALUE_THRESHOLD_CENTS else "medium"
         suggestions = self._suggest_actions(amount_cents, customer_label)
 
-        content = (
-            f"---\n"
-            f"type: stripe_payment\n"
-            f"amount: {amount_display} {currency}\n"
-            f"customer: \"{customer_label}\"\n"
-            f"received: {received}\n"
-            f"priority: {priority}\n"
-            f"status: succeeded\n"
-            f"charge_id: {charge_id}\n"
-            f"event_id: {event_id}\n"
-            f"---\n"
-            f"\n"
-            f"## Payment Details\n"
-            f"\n"
-            f"**Amount:** {amount_display} {currency}\n"
-            f"**Customer:** {customer_label}\n"
-            f"**Description:** {description}\n"
-            f"**Charge ID:** `{charge_id}`\n"
-            f"**Received:** {received}\n"
-            f"\n"
-            f"## Suggested Actions\n"
-            f"\n"
-            f"{suggestions}"
+        content = PAYMENT_TEMPLATE.format(
+            amount_display=amount_display,
+            currency=currency,
+            customer_label=customer_label,
+            received=received,
+            priority=priority,
+            charge_id=charge_id,
+            event_id=event_id,
+            description=description,
+            suggestions=suggestions,
         )
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"STRIPE_{charge_id}_{timestamp}.md"
-        filepath = self.needs_action / filename
-        filepath.write_text(content, encoding="utf-8")
+        # charge_id is unique per payment, so the name is deterministic;
+        # recording it as processed skips the payment's other event
+        filename = f"STRIPE_{charge_id}.md"
+        filepath = self.write_action_file(filename, content)
 
         self._save_processed_id(event_id)
+        self._save_processed_id(charge_id)
         self.logger.info(
             "Action file created: %s (%s %s from %s)",
             filename,
@@ -213,10 +402,87 @@ class StripeWatcher(BaseWatcher):
         )
         return filepath
 
+    # ------------------------------------------------------------------
+    # Webhook delivery
+    # ------------------------------------------------------------------
+
+    def run_pushed(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """Event-driven alternative to run(): receive Stripe webhooks.
+
+        Serves POST requests on host:port, verifies each payload against
+        STRIPE_WEBHOOK_SECRET, and files succeeded payments immediately.
+        """
+        webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET", "").strip()
+        if not webhook_secret:
+            self.logger.critical(
+                "STRIPE_WEBHOOK_SECRET is not set.  "
+                "Export the endpoint's signing secret (whsec_...) before running."
+            )
+            sys.exit(1)
+
+        watcher = self
+
+        class _WebhookHandler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = self.rfile.read(length)
+                signature = self.headers.get("Stripe-Signature", "")
+
+                try:
+                    event = stripe.Webhook.construct_event(
+                        payload, signature, webhook_secret
+                    )
+                except (ValueError, stripe.error.SignatureVerificationError):
+                    watcher.logger.warning("Rejected webhook with invalid signature")
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+
+                # Acknowledge first — Stripe retries slow endpoints
+                self.send_response(200)
+                self.end_headers()
+                watcher._handle_webhook_event(event)
+
+            def log_message(self, format, *args) -> None:
+                watcher.logger.debug("Webhook %s", format % args)
+
+        # Single-threaded on purpose: events are handled one at a time, so a
+        # retried delivery can never race its original past the dedup check
+        server = HTTPServer((host, port), _WebhookHandler)
+        self.logger.info("Listening for Stripe webhooks on http://%s:%d", host, port)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.logger.info("Shutting down %s gracefully", self.__class__.__name__)
+        finally:
+            server.server_close()
+            self.close()
+
+    def _handle_webhook_event(self, event) -> None:
+        """File a verified webhook event unless it was already processed."""
+        if event.type not in EVENT_TYPES:
+            self.logger.debug("Ignoring webhook event type %s", event.type)
+            return
+        if self._is_filed(event):
+            self.logger.debug("Ignoring already processed event %s", event.id)
+            return
+        try:
+            self.handle_updates([event])
+        except Exception:
+            self.logger.exception("Error handling Stripe webhook event %s", event.id)
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _event_charge_id(event) -> str:
+        """Return the charge ID a charge or payment_intent event refers to."""
+        obj = event.data.object
+        if event.type == "payment_intent.succeeded":
+            return obj.get("latest_charge") or obj.get("id", "unknown")
+        return obj.get("id", "unknown")
+
     @staticmethod
     def _extract_charge_data(obj, event_type: str) -> dict:
         """Normalise fields from either a Charge or PaymentIntent object."""
@@ -299,10 +565,24 @@ if __name__ == "__main__":
         default=300,
         help="Poll interval in seconds (default: 300)",
     )
+    parser.add_argument(
+        "--webhook",
+        action="store_true",
+        help="Receive webhooks instead of polling (needs STRIPE_WEBHOOK_SECRET)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Webhook listen port on 127.0.0.1 (default: 8000)",
+    )
     args = parser.parse_args()
 
     watcher = StripeWatcher(vault_path=args.vault, check_interval=args.interval)
-    watcher.run()
+    if args.webhook:
+        watcher.run_pushed(port=args.port)
+    else:
+        watcher.run()
 
 
 # ======================================================================
@@ -343,15 +623,28 @@ if __name__ == "__main__":
 #      Dashboard → Payments → + Create → use card 4242 4242 4242 4242
 #    The watcher will pick them up on the next poll cycle.
 #
-# 6. WEBHOOK ALTERNATIVE (Advanced)
-#    For real-time notifications instead of polling, set up a
-#    Stripe webhook endpoint pointing to your server.  The watcher
-#    approach is simpler and works without a public server.
+# 6. WEBHOOK MODE (Advanced)
+#    For real-time notifications instead of polling, run the watcher
+#    with --webhook.  It listens on 127.0.0.1 only, so forward events
+#    to it with the Stripe CLI (or a reverse proxy / tunnel):
+#
+#    stripe listen --forward-to localhost:8000 \
+#        --events charge.succeeded,payment_intent.succeeded
+#
+#    Copy the printed signing secret and start the watcher:
+#
+#    export STRIPE_WEBHOOK_SECRET="whsec_..."
+#    python stripe_watcher.py /path/to/vault --webhook --port 8000
+#
+#    Every payload is verified against the signing secret before an
+#    action file is written.  Polling remains the default and needs
+#    no public endpoint.
 #
 # 7. SECURITY CHECKLIST
 #    - [ ] API key is in an environment variable, NOT in source code
 #    - [ ] .env / secrets files are in .gitignore
 #    - [ ] Using sk_test_ keys during development
-#    - [ ] processed_stripe_ids.txt is in .gitignore (contains event IDs)
+#    - [ ] processed_stripe_ids.txt and stripe_last_event_id.txt are in
+#          .gitignore (contain event IDs)
 #    - [ ] High-value payments (>$500) require Pending_Approval workflow
 #
@@ -7,6 +7,7 @@ approved action (send email, etc.) via the local MCP servers.
 REQUIREMENTS
 ------------
     pip install watchdog
+    pip install orjson      # optional — faster JSON for MCP calls and event logs
 
 USAGE
 -----
@@ -16,25 +17,78 @@ USAGE
 """
 
 import argparse
+import atexit
+import errno
+import functools
+import http.client
 import json
 import logging
+import logging.handlers
+import mmap
 import os
+import queue
 import re
 import shutil
+import string
 import subprocess
 import sys
+import threading
 import time
-import urllib.request
-import urllib.error
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
 
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent, FileMovedEvent
 
 # MCP server base URL — localhost only, never remote
 MCP_EMAIL_URL = "http://127.0.0.1:3000/send-email"
 
+# Idle keep-alive connections to the MCP server, reused across approvals
+MCP_MAX_CONNECTIONS = 8
+_mcp_idle: list[http.client.HTTPConnection] = []
+_mcp_lock = threading.Lock()
+
+# Approvals executed at the same time (each may wait on the MCP server)
+APPROVAL_WORKERS = 8
+
+# Number of tasks handed to Claude Code at the same time.  Every run
+# read-modify-writes Dashboard.md, so concurrent runs can lose each other's
+# updates — parallelism is opt-in via --workers
+DEFAULT_WORKERS = 1
+
+# Watchdog events buffered before they spill to Logs/event_overflow.txt
+EVENT_QUEUE_SIZE = 1024
+
+# Seconds a path must go without new events before it is dispatched
+EVENT_DEBOUNCE = 0.15
+
+# ------------------------------------------------------------------
+# JSON (orjson when installed, stdlib otherwise)
+# ------------------------------------------------------------------
+
+def _json_bytes(obj) -> bytes:
+    """Serialise *obj* straight to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # ------------------------------------------------------------------
 # Logging
 # ------------------------------------------------------------------
@@ -44,7 +98,16 @@ logger = logging.getLogger("TaskProcessor")
 
 
 def setup_logging(vault_path: Path, log_to_file: bool = False) -> None:
-    """Configure console logging and optional file logging into vault/Logs/."""
+    """Configure console logging and optional file logging into vault/Logs/.
+
+    Records are put on a queue and written by a background listener
+    thread, so handler and worker threads never block on log I/O.
+    """
+    # Log lines contain →, — etc.; never fail on a narrow console code page
+    try:
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    except AttributeError:
+        pass
     handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
 
     if log_to_file:
@@ -54,34 +117,103 @@ def setup_logging(vault_path: Path, log_to_file: bool = False) -> None:
         log_file = logs_dir / f"processor_{date_stamp}.log"
         handlers.append(logging.FileHandler(str(log_file), encoding="utf-8"))
 
-    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=handlers)
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The queue carries the bare message; the listener's handlers format it
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 
 # ------------------------------------------------------------------
 # Folder helper
 # ------------------------------------------------------------------
 
+VAULT_FOLDERS = (
+    "Needs_Action",
+    "In_Progress",
+    "Plans",
+    "Done",
+    "Pending_Approval",
+    "Approved",
+    "Rejected",
+    "Accounting",
+    "Logs",
+    "Briefings",
+    "Updates",
+)
+
+# Vaults whose folder tree is known to be complete, with the vault
+# directory's mtime at that point (adding or removing a folder changes it)
+_folders_cache: dict[str, tuple[int, dict[str, Path]]] = {}
+
+
 def ensure_folders(vault: Path) -> dict[str, Path]:
-    """Create all required vault folders and return a name→Path mapping."""
-    names = [
-        "Needs_Action",
-        "In_Progress",
-        "Plans",
-        "Done",
-        "Pending_Approval",
-        "Approved",
-        "Rejected",
-        "Accounting",
-        "Logs",
-        "Briefings",
-        "Updates",
-    ]
-    folders: dict[str, Path] = {}
-    for name in names:
-        p = vault / name
-        p.mkdir(parents=True, exist_ok=True)
-        folders[name] = p
-    return folders
+    """Create all required vault folders and return a name→Path mapping.
+
+    Repeat calls for an unchanged vault cost a single stat().
+    """
+    key = str(vault)
+    cached = _folders_cache.get(key)
+    if cached is not None:
+        try:
+            if os.stat(key).st_mtime_ns == cached[0]:
+                return dict(cached[1])
+        except FileNotFoundError:
+            pass
+
+    # One directory listing tells us which folders are missing
+    try:
+        with os.scandir(vault) as it:
+            existing = {e.name for e in it if e.is_dir()}
+    except FileNotFoundError:
+        vault.mkdir(parents=True, exist_ok=True)
+        existing = set()
+
+    for name in VAULT_FOLDERS:
+        if name not in existing:
+            (vault / name).mkdir(exist_ok=True)
+
+    folders = {name: vault / name for name in VAULT_FOLDERS}
+    _folders_cache[key] = (os.stat(key).st_mtime_ns, folders)
+    return dict(folders)
+
+
+def invalidate_folders_cache() -> None:
+    """Make the next ensure_folders() call check the folders on disk again."""
+    _folders_cache.clear()
+
+
+# ------------------------------------------------------------------
+# Timestamps
+# ------------------------------------------------------------------
+
+def _stamps(ts: datetime | None = None) -> tuple[datetime, str, str, str]:
+    """Return (ts, ISO string, human-readable string, filename stamp).
+
+    Pass the same *ts* to every log written for one event so they all
+    carry an identical time; defaults to now.  The strings for recent
+    timestamps are cached, so the logs of one event format it once.
+    """
+    ts = ts or datetime.now()
+    return (ts, *_format_stamps(ts))
+
+
+@functools.lru_cache(maxsize=64)
+def _format_stamps(ts: datetime) -> tuple[str, str, str]:
+    human = ts.strftime("%Y-%m-%d %H:%M:%S")
+    # YYYYmmdd_HHMMSS sliced out of the human string — one strftime call
+    file_ts = f"{human[:4]}{human[5:7]}{human[8:10]}_{human[11:13]}{human[14:16]}{human[17:19]}"
+    return ts.isoformat(), human, file_ts
 
 
 # ------------------------------------------------------------------
@@ -112,6 +244,44 @@ Steps to execute:
    Otherwise leave it in In_Progress/ and note what is blocked.
 """
 
+# CLAUDE_PROMPT_TEMPLATE split once into (literal text, field name) pairs
+_PROMPT_PARTS = tuple(
+    (literal, field)
+    for literal, field, _spec, _conv in string.Formatter().parse(CLAUDE_PROMPT_TEMPLATE)
+)
+
+
+def _build_prompt(filename: str, stem: str, date: str) -> str:
+    """Fill CLAUDE_PROMPT_TEMPLATE from its pre-parsed parts."""
+    values = {"filename": filename, "stem": stem, "date": date}
+    out: list[str] = []
+    for literal, field in _PROMPT_PARTS:
+        out.append(literal)
+        if field is not None:
+            out.append(values[field])
+    return "".join(out)
+
+
+# Claude Code processes currently running, so shutdown can stop them
+_claude_procs: set[subprocess.Popen] = set()
+_claude_procs_lock = threading.Lock()
+
+# Set by WorkerPool.terminate() before it kills Claude; a run that fails
+# after this was stopped by us, not by a problem with its task
+_shutting_down = threading.Event()
+
+# Bytes of Claude's stdout/stderr kept for logging (only the tail is logged)
+OUTPUT_TAIL_BYTES = 8192
+
+
+def _read_tail(stream, tail: bytearray, limit: int = OUTPUT_TAIL_BYTES) -> None:
+    """Drain *stream* to EOF, keeping only its last *limit* bytes in *tail*."""
+    with stream:
+        for chunk in iter(lambda: stream.read1(4096), b""):
+            tail += chunk
+            if len(tail) > limit:
+                del tail[:-limit]
+
 
 def invoke_claude(vault: Path, task_file: Path, dry_run: bool = False) -> bool:
     """Call Claude Code as a subprocess to process a single task file.
@@ -120,11 +290,7 @@ def invoke_claude(vault: Path, task_file: Path, dry_run: bool = False) -> bool:
     """
     filename = task_file.name
     stem = task_file.stem
-    prompt = CLAUDE_PROMPT_TEMPLATE.format(
-        filename=filename,
-        stem=stem,
-        date=datetime.now().strftime("%Y%m%d"),
-    )
+    prompt = _build_prompt(filename, stem, datetime.now().strftime("%Y%m%d"))
 
     # On Windows, npm installs CLI tools as .cmd scripts
     claude_bin = "claude.cmd" if sys.platform == "win32" else "claude"
@@ -147,35 +313,59 @@ def invoke_claude(vault: Path, task_file: Path, dry_run: bool = False) -> bool:
         env = os.environ.copy()
         env.pop("CLAUDECODE", None)
 
-        result = subprocess.run(
+        proc = subprocess.Popen(
             command,
-            capture_output=True,
-            text=True,
-            timeout=300,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             cwd=str(vault),
             env=env,
         )
+        with _claude_procs_lock:
+            _claude_procs.add(proc)
+
+        # Drain both pipes as the output arrives, keeping only the tails,
+        # so memory stays bounded however much Claude prints
+        stdout_tail, stderr_tail = bytearray(), bytearray()
+        readers = [
+            threading.Thread(target=_read_tail, args=(proc.stdout, stdout_tail), daemon=True),
+            threading.Thread(target=_read_tail, args=(proc.stderr, stderr_tail), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            proc.wait(timeout=300)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            logger.error("Claude timed out (300s) processing: %s", filename)
+            return False
+        finally:
+            # Bounded: a killed Claude's own children may still hold the pipes
+            for reader in readers:
+                reader.join(timeout=5)
+            with _claude_procs_lock:
+                _claude_procs.discard(proc)
+
+        stdout = stdout_tail.decode("utf-8", errors="replace")
+        stderr = stderr_tail.decode("utf-8", errors="replace")
 
-        if result.stdout:
-            logger.info("Claude output:\n%s", result.stdout[-2000:])
+        if stdout:
+            logger.info("Claude output:\n%s", stdout[-2000:])
 
-        if result.stderr:
-            logger.warning("Claude stderr:\n%s", result.stderr[-1000:])
+        if stderr:
+            logger.warning("Claude stderr:\n%s", stderr[-1000:])
 
-        if result.returncode == 0:
+        if proc.returncode == 0:
             logger.info("Claude completed successfully for: %s", filename)
             return True
         else:
             logger.error(
                 "Claude exited with code %d for: %s",
-                result.returncode,
+                proc.returncode,
                 filename,
             )
             return False
 
-    except subprocess.TimeoutExpired:
-        logger.error("Claude timed out (300s) processing: %s", filename)
-        return False
     except FileNotFoundError:
         logger.critical(
             "Claude CLI not found — make sure 'claude' is installed and on PATH. "
@@ -187,75 +377,331 @@ def invoke_claude(vault: Path, task_file: Path, dry_run: bool = False) -> bool:
         return False
 
 
+class WorkerPool:
+    """Run tasks (Claude Code runs, approvals) on a fixed number of threads.
+
+    Each Claude task still runs in its own Claude Code process; the pool
+    lets several of them run at once and keeps callers (the event
+    dispatcher) from blocking while they do.
+    """
+
+    def __init__(self, size: int = DEFAULT_WORKERS, name: str = "worker") -> None:
+        self.size = max(1, size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix=name
+        )
+
+    def submit(self, fn, *args) -> Future:
+        """Queue fn(*args) for the next free worker; exceptions are logged."""
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Worker task failed", exc_info=future.exception())
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting tasks; queued and running ones still finish."""
+        self._executor.shutdown(wait=wait)
+
+    def terminate(self) -> None:
+        """Drop queued tasks and kill running Claude Code processes.
+
+        Tasks whose Claude run is killed go back to Needs_Action/ rather
+        than to Logs/Error_*/ (see NeedsActionHandler._handle_new_task).
+        """
+        _shutting_down.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with _claude_procs_lock:
+            procs = list(_claude_procs)
+        for proc in procs:
+            proc.kill()
+        if procs:
+            logger.info("Stopped %d running Claude process(es)", len(procs))
+
+
 # ------------------------------------------------------------------
 # File movement helpers
 # ------------------------------------------------------------------
 
+def await_stable(path: Path, timeout: float = 2.0, interval: float = 0.02) -> bool:
+    """Wait until *path* has stopped changing (the writer has finished).
+
+    Returns True once two successive samples of size and mtime match, or
+    after *timeout* seconds; False if the file has disappeared.
+    """
+    deadline = time.monotonic() + timeout
+    previous = None
+    while True:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return False
+        current = (st.st_size, st.st_mtime_ns)
+        if current == previous or time.monotonic() >= deadline:
+            return True
+        previous = current
+        time.sleep(interval)
+
+
+def _rename(src: Path | str, dest: Path | str) -> None:
+    """Rename *src* to *dest* with one os.replace call.
+
+    Vault folders share a filesystem, so this is the normal path; a
+    cross-device move (EXDEV) falls back to shutil.move's copy + delete.
+    """
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dest))
+
+
+# Next collision counter to try, per (dest_dir, stem, suffix)
+_next_counter: dict[tuple[str, str, str], int] = {}
+_next_counter_lock = threading.Lock()
+
+# Destination folders where os.link() has failed (FAT, some network
+# shares), so later moves go straight to the checked plain move
+_link_unsupported: set[str] = set()
+
+
+def _claim(src: str, dest: str) -> bool:
+    """Move *src* to *dest* only if *dest* does not exist yet.
+
+    A hard link fails atomically when the target exists, so two threads
+    can never claim the same name.  Where hard links are unavailable
+    (another filesystem, FAT) this falls back to a checked plain move,
+    and the folder is remembered so the link is not attempted again.
+    Returns False if *dest* is already taken.
+    """
+    dest_dir = os.path.dirname(dest)
+    if dest_dir not in _link_unsupported:
+        try:
+            os.link(src, dest)
+        except FileExistsError:
+            return False
+        except FileNotFoundError:
+            raise
+        except OSError:
+            _link_unsupported.add(dest_dir)
+        else:
+            os.unlink(src)
+            return True
+
+    if os.path.exists(dest):
+        return False
+    _rename(src, dest)
+    return True
+
+
 def move_file(src: Path, dest_dir: Path, prefix: str = "") -> Path:
-    """Move a file into dest_dir, optionally prepending a prefix to the name."""
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    new_name = f"{prefix}{src.name}" if prefix else src.name
-    dest = dest_dir / new_name
-
-    # Avoid overwriting — append a counter if the destination exists
-    counter = 1
-    while dest.exists():
-        dest = dest_dir / f"{src.stem}_{counter}{src.suffix}"
-        counter += 1
-
-    shutil.move(str(src), str(dest))
-    logger.info("Moved: %s → %s", src.name, dest)
-    return dest
+    """Move a file into dest_dir, optionally prepending a prefix to the name.
+
+    dest_dir is normally created by ensure_folders() at startup; it is
+    only (re)created here if the move fails because it is missing.
+    Works on plain string paths throughout and builds a single Path for
+    the return value.
+    """
+    src = os.fspath(src)
+    dest_dir = os.fspath(dest_dir)
+    name = os.path.basename(src)
+    dest = os.path.join(dest_dir, prefix + name)
+
+    try:
+        moved = _claim(src, dest)
+    except FileNotFoundError:
+        if os.path.isdir(dest_dir):
+            raise  # the source is gone, not the destination
+        os.makedirs(dest_dir, exist_ok=True)
+        moved = _claim(src, dest)
+
+    # Avoid overwriting — append a counter if the destination exists,
+    # starting after the last counter used for this name
+    if not moved:
+        stem, suffix = os.path.splitext(name)
+        key = (dest_dir, stem, suffix)
+        with _next_counter_lock:
+            counter = _next_counter.get(key, 1)
+        while True:
+            dest = os.path.join(dest_dir, f"{stem}_{counter}{suffix}")
+            counter += 1
+            if _claim(src, dest):
+                break
+        with _next_counter_lock:
+            _next_counter[key] = max(counter, _next_counter.get(key, 1))
+
+    forget_frontmatter(src)
+    logger.info("Moved: %s → %s", name, dest)
+    return Path(dest)
 
 
 def move_to_error(task_file: Path, logs_dir: Path) -> Path:
     """Move a failed task file into a timestamped error folder inside Logs/."""
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    error_dir = logs_dir / f"Error_{ts}"
-    error_dir.mkdir(parents=True, exist_ok=True)
+    file_ts = _stamps()[3]
+    error_dir = logs_dir / f"Error_{file_ts}"
+    error_dir.mkdir(exist_ok=True)  # Logs/ itself comes from ensure_folders()
     dest = error_dir / task_file.name
-    shutil.move(str(task_file), str(dest))
+    _rename(task_file, dest)
+    forget_frontmatter(task_file)
     logger.info("Moved failed task to: %s", dest)
     return dest
 
 
+def _write_file(path: Path, text: str) -> None:
+    """Write a small log or notification file in one os.write call.
+
+    No buffered file object and no fsync: the OS flushes these files in
+    its own time, which is durable enough for logs and notifications.
+    """
+    fd = os.open(
+        path,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+        0o644,
+    )
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
 # ------------------------------------------------------------------
 # Frontmatter parser
 # ------------------------------------------------------------------
 
-def parse_frontmatter(file_path: Path) -> dict[str, str]:
+# Opening --- line, the header, and the closing --- line, matched in one
+# pass of the regex engine over the raw bytes
+FRONTMATTER_RE = re.compile(
+    rb"\A---[ \t\r]*\n(.*?)^[ \t]*---[ \t\r]*(?:\n|\Z)",
+    re.DOTALL | re.MULTILINE,
+)
+
+# Parsed frontmatter kept per file; entries are reused only while the
+# file's mtime and size are unchanged
+FRONTMATTER_CACHE_SIZE = 4096
+
+# Header-only parses read this much of the file first, doubling the read
+# until the closing --- line turns up or the limit is reached
+FRONTMATTER_HEAD_BYTES = 4096
+FRONTMATTER_MAX_HEAD = 65536
+_fm_cache: OrderedDict[str, tuple[int, int, dict[str, str]]] = OrderedDict()
+_fm_cache_lock = threading.Lock()
+
+
+def parse_frontmatter(file_path: Path, with_body: bool = True) -> dict[str, str]:
     """Read a markdown file and extract YAML frontmatter key-value pairs.
 
     Returns a flat dict of string→string.  Handles quoted and unquoted values.
-    Non-frontmatter content is stored under the key '__body__'.
+    Non-frontmatter content is stored under the key '__body__'; with
+    *with_body* False only the head of the file is read and '__body__'
+    may be missing.
+
+    Results are cached by path and revalidated with one stat(), so a file
+    that has not changed since it was last parsed is not read again.
     """
-    text = file_path.read_text(encoding="utf-8")
-    meta: dict[str, str] = {}
+    key = str(file_path)
+    st = os.stat(key)
+    with _fm_cache_lock:
+        entry = _fm_cache.get(key)
+        if (
+            entry is not None
+            and entry[:2] == (st.st_mtime_ns, st.st_size)
+            and (not with_body or "__body__" in entry[2])
+        ):
+            _fm_cache.move_to_end(key)
+            return entry[2].copy()
+
+    if with_body:
+        meta = _parse_frontmatter_file(file_path)
+    else:
+        meta = _parse_frontmatter_head(file_path)
+
+    with _fm_cache_lock:
+        _fm_cache[key] = (st.st_mtime_ns, st.st_size, meta)
+        while len(_fm_cache) > FRONTMATTER_CACHE_SIZE:
+            _fm_cache.popitem(last=False)
+    return meta.copy()
+
+
+def forget_frontmatter(file_path: Path | str) -> None:
+    """Drop the cached frontmatter for *file_path* (it was moved or deleted)."""
+    with _fm_cache_lock:
+        _fm_cache.pop(str(file_path), None)
+
+
+def clear_frontmatter_cache() -> None:
+    """Forget every cached frontmatter result."""
+    with _fm_cache_lock:
+        _fm_cache.clear()
+
+
+def _parse_frontmatter_file(file_path: Path) -> dict[str, str]:
+    """Parse *file_path* without the cache.
+
+    The file is memory-mapped and FRONTMATTER_RE finds both --- lines in
+    the raw bytes; only keys, values and the body are decoded.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {"__body__": ""}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            meta, body_start = _scan_frontmatter(mm)
+            if body_start is None:
+                return {"__body__": mm[:].decode("utf-8")}
+            meta["__body__"] = mm[body_start:].decode("utf-8").strip()
+    return meta
 
-    # Split on the --- delimiters
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n?(.*)", text, re.DOTALL)
-    if not match:
-        meta["__body__"] = text
-        return meta
 
-    yaml_block, body = match.group(1), match.group(2)
-    meta["__body__"] = body.strip()
+def _parse_frontmatter_head(file_path: Path) -> dict[str, str]:
+    """Parse only the frontmatter of *file_path*, without the cache.
 
-    for line in yaml_block.splitlines():
+    Reads FRONTMATTER_HEAD_BYTES and doubles the read (up to
+    FRONTMATTER_MAX_HEAD) until the closing --- line is in the buffer,
+    so a long body is never read at all.
+    """
+    size = FRONTMATTER_HEAD_BYTES
+    with open(file_path, "rb") as f:
+        head = f.read(size)
+        while True:
+            at_eof = len(head) < size
+            # Scan whole lines only — the last one may be cut short
+            meta, body_start = _scan_frontmatter(
+                head if at_eof else head[:head.rfind(b"\n") + 1]
+            )
+            if body_start is not None or at_eof or size >= FRONTMATTER_MAX_HEAD:
+                return meta
+            head += f.read(size)
+            size *= 2
+
+
+def _scan_frontmatter(mm: bytes | mmap.mmap) -> tuple[dict[str, str], int | None]:
+    """Collect the frontmatter key/value pairs at the top of *mm*.
+
+    Every value is kept as a string; surrounding quotes are stripped.
+    Returns (meta, body_start), or ({}, None) if the file has no
+    complete frontmatter block.
+    """
+    m = FRONTMATTER_RE.match(mm)
+    if m is None:
+        return {}, None
+
+    meta: dict[str, str] = {}
+    for line in m.group(1).split(b"\n"):
         line = line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[:1] == b"#":
             continue
-        colon_idx = line.find(":")
-        if colon_idx == -1:
+        key, sep, value = line.partition(b":")
+        if not sep:
             continue
-        key = line[:colon_idx].strip()
-        value = line[colon_idx + 1:].strip()
+        value = value.strip()
         # Strip surrounding quotes
-        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        if len(value) >= 2 and value[:1] == value[-1:] and value[:1] in (b'"', b"'"):
             value = value[1:-1]
-        meta[key] = value
-
-    return meta
+        meta[key.strip().decode("utf-8")] = value.decode("utf-8")
+    return meta, m.end()
 
 
 # ------------------------------------------------------------------
@@ -267,9 +713,11 @@ def execute_action(
     meta: dict[str, str],
     folders: dict[str, Path],
     dry_run: bool = False,
+    ts: datetime | None = None,
 ) -> bool:
     """Dispatch an approved action based on its action_type.
 
+    *ts* is the approval time, reused for every log the action writes.
     Returns True on success, False on failure.
     """
     action_type = meta.get("action_type", "").strip().lower()
@@ -283,20 +731,78 @@ def execute_action(
 
     logger.info("Executing action_type='%s' from %s", action_type, approved_file.name)
 
-    dispatch: dict[str, callable] = {
-        "send_email": _action_send_email,
-        "post_linkedin": _action_placeholder,
-        "post_twitter": _action_placeholder,
-        "create_invoice": _action_placeholder,
-        "schedule_meeting": _action_placeholder,
-    }
-
-    handler = dispatch.get(action_type)
+    handler = ACTION_HANDLERS.get(action_type)
     if handler is None:
         logger.error("Unknown action_type '%s' in %s", action_type, approved_file.name)
         return False
 
-    return handler(approved_file, meta, folders, dry_run)
+    return handler(approved_file, meta, folders, dry_run, ts)
+
+
+class MCPHTTPError(Exception):
+    """The MCP server answered with an HTTP error status."""
+
+    def __init__(self, status: int, reason: str, body: str) -> None:
+        super().__init__(f"HTTP {status}: {body or reason}")
+        self.status = status
+        self.reason = reason
+        self.body = body
+
+
+def _mcp_request(payload: dict, timeout: float = 30) -> dict:
+    """POST *payload* as JSON to MCP_EMAIL_URL and return the decoded reply.
+
+    Takes an idle keep-alive connection from a small pool (or opens one),
+    so concurrent approvals send in parallel.  /send-email is not
+    idempotent, so the only retry is for a pooled connection the server
+    had already closed: the send fails with BrokenPipeError, or the reply
+    with RemoteDisconnected, and the request is repeated once on a fresh
+    connection.  Any other failure, or any failure on a fresh connection,
+    is raised.  Raises MCPHTTPError for HTTP error statuses and OSError if
+    the server cannot be reached.
+    """
+    url = urlsplit(MCP_EMAIL_URL)
+    body = _json_bytes(payload)
+
+    with _mcp_lock:
+        conn = _mcp_idle.pop() if _mcp_idle else None
+    reused = conn is not None
+
+    while True:
+        if conn is None:
+            conn = http.client.HTTPConnection(url.hostname, url.port, timeout=timeout)
+        try:
+            conn.request(
+                "POST", url.path, body=body,
+                headers={"Content-Type": "application/json"},
+            )
+            resp = conn.getresponse()
+            data = resp.read()
+            break
+        except (http.client.RemoteDisconnected, BrokenPipeError):
+            conn.close()
+            conn = None
+            if not reused:
+                raise
+            reused = False  # stale pooled connection — one retry, fresh
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            raise
+
+    with _mcp_lock:
+        if len(_mcp_idle) < MCP_MAX_CONNECTIONS:
+            _mcp_idle.append(conn)
+            conn = None
+    if conn is not None:
+        conn.close()
+
+    if resp.status >= 400:
+        raise MCPHTTPError(resp.status, resp.reason, data.decode("utf-8", errors="replace"))
+    return _json_loads(data)
+
+
+# Plausible single address: local@domain.tld, no spaces
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 def _action_send_email(
@@ -304,11 +810,17 @@ def _action_send_email(
     meta: dict[str, str],
     folders: dict[str, Path],
     dry_run: bool,
+    ts: datetime | None = None,
 ) -> bool:
     """Send an email via the local MCP Email Server (POST /send-email)."""
     to = meta.get("to", "").strip()
     subject = meta.get("subject", "").strip()
-    body = meta.get("body", "").strip() or meta.get("__body__", "").strip()
+    body = meta.get("body", "").strip()
+    if not body:
+        body = meta.get("__body__")
+        if body is None:  # the caller parsed the header only
+            body = parse_frontmatter(approved_file).get("__body__", "")
+        body = body.strip()
 
     # ---- Validate required fields ----
     missing = []
@@ -327,7 +839,7 @@ def _action_send_email(
         )
         return False
 
-    if "@" not in to:
+    if not EMAIL_RE.fullmatch(to):
         logger.error("Invalid email address '%s' in %s", to, approved_file.name)
         return False
 
@@ -352,16 +864,9 @@ def _action_send_email(
         logger.info("[DRY RUN] Would POST to %s with payload: %s", MCP_EMAIL_URL, json.dumps(payload))
         return True
 
-    # ---- Call MCP server via urllib (no extra dependency) ----
+    # ---- Call MCP server over a reused http.client connection ----
     try:
-        req = urllib.request.Request(
-            MCP_EMAIL_URL,
-            data=json.dumps(payload).encode("utf-8"),
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            resp_body = json.loads(resp.read().decode("utf-8"))
+        resp_body = _mcp_request(payload)
 
         if resp_body.get("success"):
             message_id = resp_body.get("messageId", "unknown")
@@ -369,6 +874,7 @@ def _action_send_email(
             _log_action_result(
                 folders, approved_file, "SUCCESS", "send_email",
                 f"Email sent to {to} (messageId={message_id})",
+                ts=ts,
             )
             return True
         else:
@@ -377,31 +883,29 @@ def _action_send_email(
             _log_action_result(
                 folders, approved_file, "FAILED", "send_email",
                 f"MCP error: {error_msg}",
+                ts=ts,
             )
             return False
 
-    except urllib.error.HTTPError as e:
-        error_body = ""
-        try:
-            error_body = e.read().decode("utf-8")
-        except Exception:
-            pass
-        logger.error("MCP HTTP error %d: %s", e.code, error_body or e.reason)
+    except MCPHTTPError as e:
+        logger.error("MCP HTTP error %d: %s", e.status, e.body or e.reason)
         _log_action_result(
             folders, approved_file, "FAILED", "send_email",
-            f"HTTP {e.code}: {error_body or e.reason}",
+            f"HTTP {e.status}: {e.body or e.reason}",
+            ts=ts,
         )
         return False
 
-    except urllib.error.URLError as e:
+    except OSError as e:
         logger.error(
             "Cannot reach MCP Email Server at %s — is it running?  Error: %s",
             MCP_EMAIL_URL,
-            e.reason,
+            e,
         )
         _log_action_result(
             folders, approved_file, "FAILED", "send_email",
-            f"Connection failed: {e.reason}",
+            f"Connection failed: {e}",
+            ts=ts,
         )
         return False
 
@@ -410,15 +914,43 @@ def _action_send_email(
         _log_action_result(
             folders, approved_file, "FAILED", "send_email",
             "Unexpected error — see processor logs",
+            ts=ts,
         )
         return False
 
 
+# Needs_Action/ task for an approved action with no automated handler
+PLACEHOLDER_TEMPLATE = (
+    "---\n"
+    "type: action_not_implemented\n"
+    "original_file: \"{original_file}\"\n"
+    "action_type: {action_type}\n"
+    "created: {created}\n"
+    "priority: medium\n"
+    "status: pending\n"
+    "---\n"
+    "\n"
+    "## Action Not Yet Implemented\n"
+    "\n"
+    "The action **{action_type}** was approved but has no automated handler yet.\n"
+    "Please execute manually.\n"
+    "\n"
+    "**Original file:** {original_file}\n"
+    "\n"
+    "## Manual Steps\n"
+    "\n"
+    "- [ ] Perform the '{action_type}' action manually\n"
+    "- [ ] Move original to `Done/` when complete\n"
+    "- [ ] Log outcome in `Logs/`\n"
+)
+
+
 def _action_placeholder(
     approved_file: Path,
     meta: dict[str, str],
     folders: dict[str, Path],
     dry_run: bool,
+    ts: datetime | None = None,
 ) -> bool:
     """Placeholder for future action types (LinkedIn, Twitter, invoicing, etc.)."""
     action_type = meta.get("action_type", "unknown")
@@ -429,83 +961,343 @@ def _action_placeholder(
         approved_file.name,
     )
 
-    ts = datetime.now()
-    notification = (
-        f"---\n"
-        f"type: action_not_implemented\n"
-        f"original_file: \"{approved_file.name}\"\n"
-        f"action_type: {action_type}\n"
-        f"created: {ts.isoformat()}\n"
-        f"priority: medium\n"
-        f"status: pending\n"
-        f"---\n"
-        f"\n"
-        f"## Action Not Yet Implemented\n"
-        f"\n"
-        f"The action **{action_type}** was approved but has no automated handler yet.\n"
-        f"Please execute manually.\n"
-        f"\n"
-        f"**Original file:** {approved_file.name}\n"
-        f"\n"
-        f"## Manual Steps\n"
-        f"\n"
-        f"- [ ] Perform the '{action_type}' action manually\n"
-        f"- [ ] Move original to `Done/` when complete\n"
-        f"- [ ] Log outcome in `Logs/`\n"
+    ts, iso, human, file_ts = _stamps(ts)
+    notification = PLACEHOLDER_TEMPLATE.format(
+        original_file=approved_file.name,
+        action_type=action_type,
+        created=iso,
     )
 
-    notif_file = folders["Needs_Action"] / f"MANUAL_{ts.strftime('%Y%m%d_%H%M%S')}_{approved_file.stem}.md"
-    notif_file.write_text(notification, encoding="utf-8")
+    notif_file = folders["Needs_Action"] / f"MANUAL_{file_ts}_{approved_file.stem}.md"
+    _write_file(notif_file, notification)
     return True  # not a failure — it's a graceful fallback
 
 
+# action_type → executor, looked up by execute_action()
+ACTION_HANDLERS: dict[str, callable] = {
+    "send_email": _action_send_email,
+    "post_linkedin": _action_placeholder,
+    "post_twitter": _action_placeholder,
+    "create_invoice": _action_placeholder,
+    "schedule_meeting": _action_placeholder,
+}
+
+
+# Open append-only fds for Logs/events_DATE.jsonl, keyed by (Logs dir, date)
+_event_logs: dict[tuple[Path, str], int] = {}
+_event_logs_lock = threading.Lock()
+
+
+def log_event(logs_dir: Path, event_type: str, ts: datetime | None = None, **fields) -> None:
+    """Append one JSON record to today's Logs/events_YYYY-MM-DD.jsonl.
+
+    The file is opened once per day with O_APPEND and each record goes
+    out in a single os.write, so concurrent writers never interleave.
+    """
+    ts, iso, human, _file_ts = _stamps(ts)
+    record = {"ts": iso, "type": event_type, **fields}
+    data = _json_bytes(record) + b"\n"
+    key = (logs_dir, human[:10])
+
+    with _event_logs_lock:
+        fd = _event_logs.get(key)
+        if fd is None:
+            # Rotate: close the previous day's file for this Logs/ dir
+            for old_key in [k for k in _event_logs if k[0] == logs_dir]:
+                os.close(_event_logs.pop(old_key))
+            fd = os.open(
+                logs_dir / f"events_{key[1]}.jsonl",
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                0o644,
+            )
+            _event_logs[key] = fd
+        os.write(fd, data)
+
+
+# Logs/ACTION_SUCCESS_*.md / ACTION_FAILED_*.md
+ACTION_LOG_TEMPLATE = (
+    "---\n"
+    "type: action_log\n"
+    "result: {result}\n"
+    "action_type: {action_type}\n"
+    "source_file: \"{source_file}\"\n"
+    "executed_at: {executed_at}\n"
+    "---\n"
+    "\n"
+    "## {heading}\n"
+    "\n"
+    "**Action:** {action_type}\n"
+    "**Source:** {source_file}\n"
+    "**Time:** {time}\n"
+    "**Details:** {details}\n"
+)
+
+
 def _log_action_result(
     folders: dict[str, Path],
     source_file: Path,
     result: str,
     action_type: str,
     details: str,
+    ts: datetime | None = None,
 ) -> Path:
-    """Write a structured log file for an action execution attempt."""
-    ts = datetime.now()
+    """Write a structured log file for an action execution attempt.
+
+    Always written as .md: weekly_briefing.py tallies action results
+    from these files.
+    """
+    ts, iso, human, file_ts = _stamps(ts)
+    log_event(
+        folders["Logs"], "action_log", ts=ts,
+        result=result.lower(), action_type=action_type,
+        source_file=source_file.name, details=details,
+    )
+
     tag = "ACTION_SUCCESS" if result == "SUCCESS" else "ACTION_FAILED"
 
-    content = (
-        f"---\n"
-        f"type: action_log\n"
-        f"result: {result.lower()}\n"
-        f"action_type: {action_type}\n"
-        f"source_file: \"{source_file.name}\"\n"
-        f"executed_at: {ts.isoformat()}\n"
-        f"---\n"
-        f"\n"
-        f"## {tag.replace('_', ' ').title()}\n"
-        f"\n"
-        f"**Action:** {action_type}\n"
-        f"**Source:** {source_file.name}\n"
-        f"**Time:** {ts.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        f"**Details:** {details}\n"
+    content = ACTION_LOG_TEMPLATE.format(
+        result=result.lower(),
+        action_type=action_type,
+        source_file=source_file.name,
+        executed_at=iso,
+        heading=tag.replace("_", " ").title(),
+        time=human,
+        details=details,
     )
 
-    log_file = folders["Logs"] / f"{tag}_{ts.strftime('%Y%m%d_%H%M%S')}_{source_file.stem}.md"
-    log_file.write_text(content, encoding="utf-8")
+    log_file = folders["Logs"] / f"{tag}_{file_ts}_{source_file.stem}.md"
+    _write_file(log_file, content)
     logger.info("Action log written: %s", log_file.name)
     return log_file
 
 
+# ------------------------------------------------------------------
+# Event queue
+# ------------------------------------------------------------------
+
+class EventDispatcher:
+    """Decouple watchdog callbacks from the work they trigger.
+
+    Handlers only put (kind, path) pairs on a bounded queue; a single
+    consumer thread pops them and calls the function routed to that kind,
+    so the observer thread never blocks.  Repeat events for the same path
+    are coalesced: a path is dispatched once it has been quiet for
+    *debounce* seconds.  If the queue is full, events are appended to
+    Logs/event_overflow.txt and replayed once it drains.
+    """
+
+    def __init__(
+        self,
+        folders: dict[str, Path],
+        maxsize: int = EVENT_QUEUE_SIZE,
+        debounce: float = EVENT_DEBOUNCE,
+    ):
+        self.queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.debounce = debounce
+        self.routes: dict[str, callable] = {}
+        self.overflow_file = folders["Logs"] / "event_overflow.txt"
+        self._overflow_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._consume, name="event-dispatcher", daemon=True
+        )
+
+    def route(self, kind: str, fn) -> None:
+        """Call fn(path) for every event of this kind."""
+        self.routes[kind] = fn
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the consumer once the event in progress is handled.
+
+        Events still queued are dropped; files left in Needs_Action/ are
+        picked up by the backlog scan on the next start.
+        """
+        self._stopping.set()
+        try:
+            self.queue.put_nowait(None)  # wake the consumer if it is idle
+        except queue.Full:
+            pass
+        self._thread.join()
+
+    def put(self, kind: str, path: Path) -> None:
+        """Queue an event without blocking; spill it to disk if the queue is full."""
+        try:
+            self.queue.put_nowait((kind, path))
+        except queue.Full:
+            logger.warning("Event queue full — spilling %s event for %s", kind, path.name)
+            with self._overflow_lock:
+                with self.overflow_file.open("ab") as f:
+                    f.write(f"{kind}\t{path}\n".encode("utf-8"))
+
+    def _consume(self) -> None:
+        # (kind, path) -> dispatch deadline, kept in deadline order
+        pending: dict[tuple[str, Path], float] = {}
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, next(iter(pending.values())) - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if item is None or self._stopping.is_set():
+                    break
+                pending.pop(item, None)
+                pending[item] = time.monotonic() + self.debounce
+
+            now = time.monotonic()
+            while pending:
+                item, deadline = next(iter(pending.items()))
+                if deadline > now:
+                    break
+                del pending[item]
+                self._dispatch(*item)
+            if not pending and self.queue.empty():
+                self._replay_overflow()
+
+    def _dispatch(self, kind: str, path: Path) -> None:
+        try:
+            self.routes[kind](path)
+        except Exception:
+            logger.exception("Error handling %s event for %s", kind, path.name)
+
+    def _replay_overflow(self) -> None:
+        """Dispatch events spilled while the queue was full."""
+        with self._overflow_lock:
+            try:
+                data = self.overflow_file.read_bytes()
+            except FileNotFoundError:
+                return
+            self.overflow_file.unlink()
+        lines = data.decode("utf-8").splitlines()
+
+        logger.info("Replaying %d spilled event(s)", len(lines))
+        for line in lines:
+            kind, _, path = line.partition("\t")
+            if path:
+                self._dispatch(kind, Path(path))
+
+
 # ------------------------------------------------------------------
 # Event handlers
 # ------------------------------------------------------------------
 
+# Logs/APPROVED_*.md (--verbose-logs only)
+APPROVAL_LOG_TEMPLATE = (
+    "---\n"
+    "type: approval_log\n"
+    "approved_file: \"{approved_file}\"\n"
+    "approved_at: {approved_at}\n"
+    "---\n"
+    "\n"
+    "## Approval Received\n"
+    "\n"
+    "**File:** {approved_file}\n"
+    "**Approved at:** {time}\n"
+)
+
+
+# Needs_Action/ALERT_FAILED_*.md
+FAILURE_ALERT_TEMPLATE = (
+    "---\n"
+    "type: action_failure_alert\n"
+    "original_file: \"{original_file}\"\n"
+    "action_type: {action_type}\n"
+    "failed_at: {failed_at}\n"
+    "priority: high\n"
+    "status: pending\n"
+    "---\n"
+    "\n"
+    "## Action Execution Failed\n"
+    "\n"
+    "The approved action **{action_type}** could not be executed.\n"
+    "\n"
+    "**Original file:** `Approved/{original_file}`\n"
+    "**Failed at:** {time}\n"
+    "\n"
+    "## Suggested Actions\n"
+    "\n"
+    "- [ ] Check `Logs/ACTION_FAILED_*.md` for error details\n"
+    "- [ ] Verify the MCP server is running (`GET http://127.0.0.1:3000/health`)\n"
+    "- [ ] Fix the issue and move the file back to `Approved/` to retry\n"
+    "- [ ] Or execute the action manually and move to `Done/`\n"
+)
+
+
+# Logs/REJECTED_*.md (--verbose-logs only)
+REJECTION_LOG_TEMPLATE = (
+    "---\n"
+    "type: rejection_log\n"
+    "rejected_file: \"{rejected_file}\"\n"
+    "rejected_at: {rejected_at}\n"
+    "---\n"
+    "\n"
+    "## Rejection Recorded\n"
+    "\n"
+    "**File:** {rejected_file}\n"
+    "**Rejected at:** {time}\n"
+    "**Reason:** (CEO to fill in)\n"
+)
+
+
+class RecentNames:
+    """Remember file names seen within the last *window* seconds.
+
+    Filters the bursts of duplicate events a single write can produce.
+    Entries expire on their own, so a handler that crashes mid-task
+    never blocks that file name for good, and memory stays bounded.
+    """
+
+    def __init__(self, window: float = 2.0, max_size: int = 4096) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def seen(self, name: str) -> bool:
+        """Return True if *name* was seen recently; otherwise record it."""
+        now = time.monotonic()
+        with self._lock:
+            while self._seen:
+                oldest, ts = next(iter(self._seen.items()))
+                if now - ts <= self.window:
+                    break
+                del self._seen[oldest]
+            if name in self._seen:
+                return True
+            self._seen[name] = now
+            while len(self._seen) > self.max_size:
+                self._seen.popitem(last=False)
+            return False
+
+
 class NeedsActionHandler(FileSystemEventHandler):
-    """Watch Needs_Action/ for new .md files and process them."""
+    """Watch Needs_Action/ for new .md files and process them.
+
+    With an event dispatcher, on_created only queues the file.  With a
+    pool, tasks are handed to its workers; without one they are
+    processed inline.
+    """
 
-    def __init__(self, vault: Path, folders: dict[str, Path], dry_run: bool = False):
+    def __init__(
+        self,
+        vault: Path,
+        folders: dict[str, Path],
+        dry_run: bool = False,
+        pool: WorkerPool | None = None,
+        events: EventDispatcher | None = None,
+    ):
         super().__init__()
         self.vault = vault
         self.folders = folders
         self.dry_run = dry_run
-        self.processing: set[str] = set()  # guard against duplicate events
+        self.pool = pool
+        self.events = events
+        self._recent = RecentNames()  # guard against duplicate events
 
     def on_created(self, event):
         if event.is_directory:
@@ -513,25 +1305,51 @@ class NeedsActionHandler(FileSystemEventHandler):
         src = Path(event.src_path)
         if src.suffix != ".md":
             return
-        if src.name in self.processing:
+        if self.events is not None:
+            self.events.put("needs", src)
+        else:
+            self.submit(src)
+
+    def on_moved(self, event):
+        # Watchers write action files under a temp name and rename them
+        # into place, which arrives as a move rather than a create
+        if event.is_directory:
+            return
+        dest = Path(event.dest_path)
+        if dest.suffix != ".md" or dest.parent != self.folders["Needs_Action"]:
             return
+        if self.events is not None:
+            self.events.put("needs", dest)
+        else:
+            self.submit(dest, settled=True)
 
-        self.processing.add(src.name)
-        try:
-            self._handle_new_task(src)
-        finally:
-            self.processing.discard(src.name)
+    def submit(self, src: Path, settled: bool = False) -> None:
+        """Process *src* on the pool (or inline), ignoring repeat events.
 
-    def _handle_new_task(self, src: Path) -> None:
+        *settled* marks a file known to be completely written, so the
+        worker does not wait for it to stop changing.
+        """
+        if self._recent.seen(src.name):
+            return
+
+        if self.pool is None:
+            self._handle_new_task(src, settled)
+        else:
+            self.pool.submit(self._handle_new_task, src, settled)
+
+    def submit_backlog(self, src: Path) -> None:
+        """Process a file found in Needs_Action/ by the startup scan."""
+        self.submit(src, settled=True)
+
+    def _handle_new_task(self, src: Path, settled: bool = False) -> None:
         """Move to In_Progress, invoke Claude, then route based on result."""
         logger.info("=" * 60)
         logger.info("New task detected: %s", src.name)
         logger.info("=" * 60)
 
-        # Brief pause — let the watcher finish writing the file
-        time.sleep(1)
-
-        if not src.exists():
+        # Let the watcher finish writing the file (backlog files were
+        # already there at startup)
+        if not settled and not await_stable(src):
             logger.warning("File vanished before processing: %s", src.name)
             return
 
@@ -548,6 +1366,15 @@ class NeedsActionHandler(FileSystemEventHandler):
                     "Task remains in In_Progress/ for review: %s",
                     in_progress_file.name,
                 )
+        elif _shutting_down.is_set():
+            # Claude was killed by shutdown — requeue the task so the next
+            # start's backlog scan picks it up again
+            if in_progress_file.exists():
+                move_file(in_progress_file, self.folders["Needs_Action"])
+                logger.info(
+                    "Shutdown interrupted task — returned to Needs_Action/: %s",
+                    in_progress_file.name,
+                )
         else:
             # Move to Logs/Error_*/
             if in_progress_file.exists():
@@ -564,12 +1391,23 @@ class ApprovalHandler(FileSystemEventHandler):
       4. On failure → write ACTION_FAILED log, create Needs_Action notification.
     """
 
-    def __init__(self, vault: Path, folders: dict[str, Path], dry_run: bool = False):
+    def __init__(
+        self,
+        vault: Path,
+        folders: dict[str, Path],
+        dry_run: bool = False,
+        events: EventDispatcher | None = None,
+        verbose_logs: bool = False,
+        pool: WorkerPool | None = None,
+    ):
         super().__init__()
         self.vault = vault
         self.folders = folders
         self.dry_run = dry_run
-        self.processing: set[str] = set()
+        self.events = events
+        self.verbose_logs = verbose_logs
+        self.pool = pool
+        self._recent = RecentNames()
 
     def on_created(self, event):
         if event.is_directory:
@@ -577,14 +1415,22 @@ class ApprovalHandler(FileSystemEventHandler):
         src = Path(event.src_path)
         if src.suffix != ".md":
             return
-        if src.name in self.processing:
-            return
+        if self.events is not None:
+            self.events.put("approval", src)
+        else:
+            self.handle(src)
 
-        self.processing.add(src.name)
-        try:
+    def handle(self, src: Path) -> None:
+        """Run the approval pipeline for *src*, ignoring repeat events.
+
+        With a pool, approvals run in parallel on its workers.
+        """
+        if self._recent.seen(src.name):
+            return
+        if self.pool is None:
             self._handle_approval(src)
-        finally:
-            self.processing.discard(src.name)
+        else:
+            self.pool.submit(self._handle_approval, src)
 
     def _handle_approval(self, approved_file: Path) -> None:
         """Full approval pipeline: log → parse → execute → route."""
@@ -592,19 +1438,18 @@ class ApprovalHandler(FileSystemEventHandler):
         logger.info("APPROVAL RECEIVED: %s", approved_file.name)
         logger.info("=" * 60)
 
-        # Brief pause — let the file system finish writing
-        time.sleep(1)
-
-        if not approved_file.exists():
+        # Let the file system finish writing
+        if not await_stable(approved_file):
             logger.warning("Approved file vanished: %s", approved_file.name)
             return
 
-        # 1. Log the approval event
-        self._log_approval(approved_file)
+        # 1. Log the approval event — one timestamp for every log it produces
+        ts = datetime.now()
+        self._log_approval(approved_file, ts)
 
         # 2. Parse frontmatter
         try:
-            meta = parse_frontmatter(approved_file)
+            meta = parse_frontmatter(approved_file, with_body=False)
         except Exception:
             logger.exception("Failed to parse frontmatter: %s", approved_file.name)
             meta = {}
@@ -619,7 +1464,7 @@ class ApprovalHandler(FileSystemEventHandler):
         # 3. Execute the action
         if action_type:
             success = execute_action(
-                approved_file, meta, self.folders, dry_run=self.dry_run
+                approved_file, meta, self.folders, dry_run=self.dry_run, ts=ts
             )
         else:
             logger.info(
@@ -634,70 +1479,64 @@ class ApprovalHandler(FileSystemEventHandler):
         elif not success and approved_file.exists():
             logger.warning("Action failed — file stays in Approved/ for retry")
             # Create a notification so the failure is visible
-            self._create_failure_notification(approved_file, meta)
+            self._create_failure_notification(approved_file, meta, ts)
+
+    def _log_approval(self, approved_file: Path, ts: datetime | None = None) -> None:
+        """Record the approval in the event log (and a .md file if verbose)."""
+        ts, iso, human, file_ts = _stamps(ts)
+        log_event(self.folders["Logs"], "approval_log", ts=ts, approved_file=approved_file.name)
+        if not self.verbose_logs:
+            logger.info("Approval logged: %s", approved_file.name)
+            return
 
-    def _log_approval(self, approved_file: Path) -> None:
-        """Write an approval log entry."""
-        ts = datetime.now()
-        log_entry = (
-            f"---\n"
-            f"type: approval_log\n"
-            f"approved_file: \"{approved_file.name}\"\n"
-            f"approved_at: {ts.isoformat()}\n"
-            f"---\n"
-            f"\n"
-            f"## Approval Received\n"
-            f"\n"
-            f"**File:** {approved_file.name}\n"
-            f"**Approved at:** {ts.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        log_entry = APPROVAL_LOG_TEMPLATE.format(
+            approved_file=approved_file.name,
+            approved_at=iso,
+            time=human,
         )
 
-        log_file = self.folders["Logs"] / f"APPROVED_{ts.strftime('%Y%m%d_%H%M%S')}_{approved_file.stem}.md"
-        log_file.write_text(log_entry, encoding="utf-8")
+        log_file = self.folders["Logs"] / f"APPROVED_{file_ts}_{approved_file.stem}.md"
+        _write_file(log_file, log_entry)
         logger.info("Approval logged: %s", log_file.name)
 
-    def _create_failure_notification(self, approved_file: Path, meta: dict) -> None:
+    def _create_failure_notification(
+        self, approved_file: Path, meta: dict, ts: datetime | None = None
+    ) -> None:
         """Create a Needs_Action file alerting that an approved action failed."""
-        ts = datetime.now()
+        ts, iso, human, file_ts = _stamps(ts)
         action_type = meta.get("action_type", "unknown")
+        log_event(
+            self.folders["Logs"], "action_failure_alert", ts=ts,
+            original_file=approved_file.name, action_type=action_type,
+        )
 
-        notification = (
-            f"---\n"
-            f"type: action_failure_alert\n"
-            f"original_file: \"{approved_file.name}\"\n"
-            f"action_type: {action_type}\n"
-            f"failed_at: {ts.isoformat()}\n"
-            f"priority: high\n"
-            f"status: pending\n"
-            f"---\n"
-            f"\n"
-            f"## Action Execution Failed\n"
-            f"\n"
-            f"The approved action **{action_type}** could not be executed.\n"
-            f"\n"
-            f"**Original file:** `Approved/{approved_file.name}`\n"
-            f"**Failed at:** {ts.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"\n"
-            f"## Suggested Actions\n"
-            f"\n"
-            f"- [ ] Check `Logs/ACTION_FAILED_*.md` for error details\n"
-            f"- [ ] Verify the MCP server is running (`GET http://127.0.0.1:3000/health`)\n"
-            f"- [ ] Fix the issue and move the file back to `Approved/` to retry\n"
-            f"- [ ] Or execute the action manually and move to `Done/`\n"
+        notification = FAILURE_ALERT_TEMPLATE.format(
+            original_file=approved_file.name,
+            action_type=action_type,
+            failed_at=iso,
+            time=human,
         )
 
-        notif_file = self.folders["Needs_Action"] / f"ALERT_FAILED_{ts.strftime('%Y%m%d_%H%M%S')}_{approved_file.stem}.md"
-        notif_file.write_text(notification, encoding="utf-8")
+        notif_file = self.folders["Needs_Action"] / f"ALERT_FAILED_{file_ts}_{approved_file.stem}.md"
+        _write_file(notif_file, notification)
         logger.info("Failure notification created: %s", notif_file.name)
 
 
 class RejectionHandler(FileSystemEventHandler):
     """Watch Rejected/ for files the CEO has declined."""
 
-    def __init__(self, vault: Path, folders: dict[str, Path]):
+    def __init__(
+        self,
+        vault: Path,
+        folders: dict[str, Path],
+        events: EventDispatcher | None = None,
+        verbose_logs: bool = False,
+    ):
         super().__init__()
         self.vault = vault
         self.folders = folders
+        self.events = events
+        self.verbose_logs = verbose_logs
 
     def on_created(self, event):
         if event.is_directory:
@@ -705,47 +1544,96 @@ class RejectionHandler(FileSystemEventHandler):
         src = Path(event.src_path)
         if src.suffix != ".md":
             return
+        if self.events is not None:
+            self.events.put("rejection", src)
+        else:
+            self.handle(src)
 
+    def handle(self, src: Path) -> None:
+        """Record the rejection in the event log (and a .md file if verbose)."""
         logger.info("REJECTION NOTED: %s", src.name)
+        ts, iso, human, file_ts = _stamps()
+        log_event(self.folders["Logs"], "rejection_log", ts=ts, rejected_file=src.name)
+        if not self.verbose_logs:
+            return
 
-        ts = datetime.now()
-        log_entry = (
-            f"---\n"
-            f"type: rejection_log\n"
-            f"rejected_file: \"{src.name}\"\n"
-            f"rejected_at: {ts.isoformat()}\n"
-            f"---\n"
-            f"\n"
-            f"## Rejection Recorded\n"
-            f"\n"
-            f"**File:** {src.name}\n"
-            f"**Rejected at:** {ts.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"**Reason:** (CEO to fill in)\n"
+        log_entry = REJECTION_LOG_TEMPLATE.format(
+            rejected_file=src.name,
+            rejected_at=iso,
+            time=human,
         )
 
-        log_file = self.folders["Logs"] / f"REJECTED_{ts.strftime('%Y%m%d_%H%M%S')}_{src.stem}.md"
-        log_file.write_text(log_entry, encoding="utf-8")
+        log_file = self.folders["Logs"] / f"REJECTED_{file_ts}_{src.stem}.md"
+        _write_file(log_file, log_entry)
         logger.info("Rejection logged: %s", log_file.name)
 
 
 # ------------------------------------------------------------------
-# Startup: process files already sitting in Needs_Action/
+# Startup: inotify limits
 # ------------------------------------------------------------------
 
-def process_backlog(vault: Path, folders: dict[str, Path], dry_run: bool) -> None:
-    """Pick up any .md files already in Needs_Action/ from before startup."""
-    needs_action = folders["Needs_Action"]
-    backlog = sorted(needs_action.glob("*.md"))
+# Below these, inotify can run out and events are silently dropped
+INOTIFY_MIN_WATCHES = 8192
+INOTIFY_MIN_INSTANCES = 128
+
+
+def check_inotify_limits() -> None:
+    """Warn if the Linux inotify limits are low enough to lose events.
 
-    if not backlog:
-        logger.info("No backlog in Needs_Action/")
+    Every process using watchdog (Obsidian sync, editors, ...) shares
+    these per-user limits; once exhausted, new files go unnoticed.
+    """
+    if not sys.platform.startswith("linux"):
         return
 
-    logger.info("Processing %d backlog file(s) from Needs_Action/", len(backlog))
-    handler = NeedsActionHandler(vault, folders, dry_run)
+    limits = [
+        ("max_user_watches", INOTIFY_MIN_WATCHES),
+        ("max_user_instances", INOTIFY_MIN_INSTANCES),
+    ]
+    for name, minimum in limits:
+        try:
+            value = int(Path(f"/proc/sys/fs/inotify/{name}").read_text().strip())
+        except (OSError, ValueError):
+            continue
+        if value < minimum:
+            logger.warning(
+                "fs.inotify.%s is %d (recommended >= %d) — file events may be "
+                "dropped.  Raise it with: sudo sysctl fs.inotify.%s=%d  "
+                "(or run with --polling-observer)",
+                name, value, minimum, name, minimum,
+            )
+
+
+# ------------------------------------------------------------------
+# Startup: find files already sitting in Needs_Action/
+# ------------------------------------------------------------------
+
+def _scan_md(folder: Path | str) -> list[os.DirEntry]:
+    """Return the .md files directly inside *folder* in one scandir pass.
+
+    DirEntry carries the file type from the directory listing itself, so
+    no per-file stat() is needed to tell files from subfolders.
+    """
+    with os.scandir(folder) as it:
+        return [e for e in it if e.name.endswith(".md") and e.is_file(follow_symlinks=False)]
 
-    for task_file in backlog:
-        handler._handle_new_task(task_file)
+
+def _iter_prefix(folder: Path | str, prefix: str, substr: str | None = None):
+    """Yield the DirEntry of each file in *folder* whose name starts with
+    *prefix* (and contains *substr*, if given) — plain string tests, no
+    fnmatch pattern per entry as with Path.glob().
+    """
+    with os.scandir(folder) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(prefix) and (substr is None or substr in name):
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def find_backlog(folders: dict[str, Path]) -> list[Path]:
+    """Return the .md files already in Needs_Action/, sorted by name."""
+    return sorted(Path(entry.path) for entry in _scan_md(folders["Needs_Action"]))
 
 
 # ------------------------------------------------------------------
@@ -776,6 +1664,26 @@ def main() -> None:
         action="store_true",
         help="Ignore existing files in Needs_Action/ on startup",
     )
+    parser.add_argument(
+        "--verbose-logs",
+        action="store_true",
+        help="Also write a Logs/*.md file per approval and rejection",
+    )
+    parser.add_argument(
+        "--polling-observer",
+        action="store_true",
+        help="Poll folders instead of using OS file events (for NFS/SMB vaults)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=(
+            f"Tasks processed by Claude Code in parallel (default: {DEFAULT_WORKERS}). "
+            "Each run edits Dashboard.md; above 1, concurrent runs can "
+            "overwrite each other's counter and activity updates"
+        ),
+    )
     args = parser.parse_args()
 
     vault = Path(args.vault).resolve()
@@ -790,37 +1698,70 @@ def main() -> None:
     logger.info("Task Processor starting")
     logger.info("Vault: %s", vault)
     logger.info("Dry run: %s", args.dry_run)
+    logger.info("Workers: %d", args.workers)
     logger.info("=" * 60)
 
-    # ---- Process any existing backlog ----
-    if not args.skip_backlog:
-        process_backlog(vault, folders, args.dry_run)
+    pool = WorkerPool(args.workers, name="claude-worker")
+    approval_pool = WorkerPool(APPROVAL_WORKERS, name="approval-worker")
 
     # ---- Set up filesystem watchers ----
-    observer = Observer()
-
-    needs_handler = NeedsActionHandler(vault, folders, dry_run=args.dry_run)
+    if args.polling_observer:
+        observer = PollingObserver(timeout=1)
+        logger.info("Using polling observer (1s interval)")
+    else:
+        check_inotify_limits()
+        observer = Observer()
+    events = EventDispatcher(folders)
+
+    needs_handler = NeedsActionHandler(
+        vault, folders, dry_run=args.dry_run, pool=pool, events=events
+    )
     observer.schedule(needs_handler, str(folders["Needs_Action"]), recursive=False)
+    events.route("needs", needs_handler.submit)
+    events.route("backlog", needs_handler.submit_backlog)
     logger.info("Watching: %s", folders["Needs_Action"])
 
-    approval_handler = ApprovalHandler(vault, folders, dry_run=args.dry_run)
+    approval_handler = ApprovalHandler(
+        vault, folders, dry_run=args.dry_run, events=events,
+        verbose_logs=args.verbose_logs, pool=approval_pool,
+    )
     observer.schedule(approval_handler, str(folders["Approved"]), recursive=False)
+    events.route("approval", approval_handler.handle)
     logger.info("Watching: %s", folders["Approved"])
 
-    rejection_handler = RejectionHandler(vault, folders)
+    rejection_handler = RejectionHandler(
+        vault, folders, events=events, verbose_logs=args.verbose_logs
+    )
     observer.schedule(rejection_handler, str(folders["Rejected"]), recursive=False)
+    events.route("rejection", rejection_handler.handle)
     logger.info("Watching: %s", folders["Rejected"])
 
+    events.start()
     observer.start()
     logger.info("All watchers active — waiting for tasks (Ctrl+C to stop)")
 
+    # ---- Queue any existing backlog alongside live events ----
+    if not args.skip_backlog:
+        backlog = find_backlog(folders)
+        if backlog:
+            logger.info("Queueing %d backlog file(s) from Needs_Action/", len(backlog))
+            for task_file in backlog:
+                events.put("backlog", task_file)
+        else:
+            logger.info("No backlog in Needs_Action/")
+
     try:
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
         logger.info("Shutdown requested — stopping watchers")
-        observer.stop()
 
+    # Dispatcher first, so nothing is handed to the pools once they are
+    # shut down; then the pools; the observer thread is joined last
+    observer.stop()
+    events.stop()
+    pool.terminate()
+    approval_pool.shutdown(wait=False)
     observer.join()
     logger.info("Task Processor stopped gracefully")
 
@@ -842,7 +1783,7 @@ if __name__ == "__main__":
 #  TaskProcessor detects file (watchdog)
 #       │
 #       ├─ 1. Move file → In_Progress/
-#       ├─ 2. Invoke Claude Code (subprocess)
+#       ├─ 2. Invoke Claude Code (subprocess, up to --workers at once)
 #       │       Claude reads:
 #       │         - The task file
 #       │         - Company_Handbook.md (rules)
@@ -860,7 +1801,7 @@ if __name__ == "__main__":
 #  CEO reviews Pending_Approval/
 #       │
 #       ├─ Moves to Approved/  → ApprovalHandler:
-#       │     1. Logs approval event
+#       │     1. Logs approval event (Logs/events_DATE.jsonl)
 #       │     2. Parses frontmatter for action_type + params
 #       │     3. Dispatches to action executor:
 #       │         send_email → POST http://127.0.0.1:3000/send-email
@@ -871,6 +1812,10 @@ if __name__ == "__main__":
 #       │
 #       └─ Moves to Rejected/  → RejectionHandler logs it
 #
+# Approvals, rejections, action results and failure alerts are appended
+# to Logs/events_YYYY-MM-DD.jsonl.  Action results are also written as
+# Logs/ACTION_*.md; --verbose-logs adds APPROVED_*/REJECTED_*.md files.
+#
 # APPROVED FILE FORMAT (frontmatter example):
 #   ---
 #   action_type: send_email
@@ -896,6 +1841,13 @@ if __name__ == "__main__":
 # Skip existing backlog on startup:
 #   python task_processor.py "E:\My Vault" --skip-backlog
 #
+# Vault on a network share (NFS/SMB) where file events are not delivered:
+#   python task_processor.py "E:\My Vault" --polling-observer
+#
+# Process up to 4 tasks at once (Dashboard.md edits may then race and
+# lose counter / Recent Activity updates):
+#   python task_processor.py "E:\My Vault" --workers 4
+#
 # Combined:
 #   python task_processor.py "E:\My Vault" --log-to-file --dry-run
 #
@@ -0,0 +1,132 @@
+"""Round-trip test for the watchers' Bloom filter of processed IDs.
+
+Covers add/contains, both save() paths (temp file + rename for a fresh
+filter, in-place sync for a memory-mapped one), load(), and the upgrade
+path that seeds a filter from a processed_*_ids.txt file.
+
+Run:  python test_bloom_filter.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+VAULT = Path(__file__).parent.resolve()
+sys.path.insert(0, str(VAULT))
+
+from bloom_filter import BloomFilter
+
+PASS = 0
+FAIL = 0
+
+
+try:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+except AttributeError:
+    pass
+
+
+def check(label: str, ok: bool, detail: str = "") -> None:
+    global PASS, FAIL
+    tag = "PASS" if ok else "FAIL"
+    if ok:
+        PASS += 1
+    else:
+        FAIL += 1
+    extra = f" - {detail}" if detail else ""
+    print(f"  [{tag}] {label}{extra}")
+
+
+FIRST = [f"evt_{i:04d}" for i in range(200)]
+SECOND = [f"msg_{i:04d}" for i in range(200)]
+UNSEEN = [f"unseen_{i:04d}" for i in range(200)]
+
+tmpdir = tempfile.TemporaryDirectory()
+root = Path(tmpdir.name)
+path = root / "processed.bloom"
+
+# ------------------------------------------------------------------
+print("\nIn-memory filter")
+bloom = BloomFilter(capacity=1000)
+for key in FIRST:
+    bloom.add(key)
+check("len() counts added IDs", len(bloom) == len(FIRST), f"len={len(bloom)}")
+check("every added ID is found", all(k in bloom for k in FIRST))
+check("unseen IDs are not found", not any(k in bloom for k in UNSEEN))
+
+# ------------------------------------------------------------------
+print("\nsave() of a fresh filter (temp file + rename)")
+bloom.save(path)
+check("file written", path.exists())
+check("temp file renamed away", not (root / "processed.bloom.tmp").exists())
+
+# ------------------------------------------------------------------
+print("\nload() (memory-mapped)")
+loaded = BloomFilter.load(path)
+check("header count restored", len(loaded) == len(FIRST), f"len={len(loaded)}")
+check("sizing restored", (loaded.num_bits, loaded.num_hashes) == (bloom.num_bits, bloom.num_hashes))
+check("every saved ID is found", all(k in loaded for k in FIRST))
+check("unseen IDs are not found", not any(k in loaded for k in UNSEEN))
+
+# ------------------------------------------------------------------
+print("\nadd() + save() after load (in-place sync)")
+inode = os.stat(path).st_ino
+for key in SECOND:
+    loaded.add(key)
+loaded.save(path)
+check("file synced in place", os.stat(path).st_ino == inode)
+check("no temp file", not (root / "processed.bloom.tmp").exists())
+loaded.close()
+
+reloaded = BloomFilter.load(path)
+check("count includes IDs added after load", len(reloaded) == len(FIRST) + len(SECOND), f"len={len(reloaded)}")
+check("IDs from both sessions are found", all(k in reloaded for k in FIRST + SECOND))
+check("unseen IDs are still not found", not any(k in reloaded for k in UNSEEN))
+
+# A mapped filter saved to another path falls back to temp file + rename
+copy_path = root / "copy.bloom"
+reloaded.save(copy_path)
+reloaded.close()
+copy = BloomFilter.load(copy_path)
+check("mapped filter saved to a new path", all(k in copy for k in FIRST + SECOND) and len(copy) == len(reloaded))
+copy.close()
+
+# ------------------------------------------------------------------
+print("\nload() of a file that is not a Bloom filter")
+bad = root / "bad.bloom"
+bad.write_bytes(b"NOPE" + bytes(64))
+try:
+    BloomFilter.load(bad)
+    check("bad magic rejected", False, "no error raised")
+except ValueError:
+    check("bad magic rejected", True)
+
+# ------------------------------------------------------------------
+print("\nUpgrade: seed from processed_*_ids.txt")
+try:
+    from stripe_watcher import StripeWatcher
+except ImportError as exc:
+    print(f"  [SKIP] StripeWatcher not importable ({exc})")
+else:
+    ids_path = root / "processed_stripe_ids.txt"
+    ids_path.write_text("\n".join(FIRST) + "\n\n", encoding="utf-8")
+    watcher = SimpleNamespace(
+        bloom_path=root / "processed_stripe_ids.bloom",
+        processed_ids_path=ids_path,
+        logger=SimpleNamespace(info=lambda *args: None),
+    )
+    seeded = StripeWatcher._load_processed_ids(watcher)
+    check("seeded from the text file", len(seeded) == len(FIRST) and all(k in seeded for k in FIRST))
+    check(".bloom file written", watcher.bloom_path.exists())
+
+    ids_path.write_text("", encoding="utf-8")
+    again = StripeWatcher._load_processed_ids(watcher)
+    check("later starts load the .bloom, not the text file", all(k in again for k in FIRST))
+    again.close()
+
+tmpdir.cleanup()
+
+print(f"\n  Passed: {PASS}/{PASS + FAIL}")
+sys.exit(0 if FAIL == 0 else 1)
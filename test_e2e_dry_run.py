@@ -6,6 +6,7 @@ Simulates the full lifecycle without any API keys or external services.
 Run:  python test_e2e_dry_run.py
 """
 
+import os
 import shutil
 import sys
 import time
@@ -24,17 +25,24 @@ from task_processor import (
     _action_send_email,
     _action_placeholder,
     _log_action_result,
+    _iter_prefix,
+    _scan_md,
 )
 
 PASS = 0
 FAIL = 0
 
 
+# Console output is UTF-8 once, so printing never fails on a narrow code
+# page (e.g. Windows cp1252 when output is redirected)
+try:
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+except AttributeError:
+    pass
+
+
 def safe_print(text: str) -> None:
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        print(text.encode("ascii", errors="replace").decode("ascii"))
+    print(text)
 
 
 def check(label: str, ok: bool, detail: str = "") -> None:
@@ -48,6 +56,20 @@ def check(label: str, ok: bool, detail: str = "") -> None:
     safe_print(f"  [{tag}] {label}{extra}")
 
 
+def count_md(folder, depth: int = 0) -> int:
+    """Count .md files in *folder* and up to *depth* levels of subfolders,
+    classifying each entry from a single scandir per folder."""
+    count = 0
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if depth:
+                    count += count_md(entry.path, depth - 1)
+            elif entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                count += 1
+    return count
+
+
 def section(title: str) -> None:
     safe_print(f"\n{'='*60}")
     safe_print(f"  {title}")
@@ -62,12 +84,12 @@ folders = ensure_folders(VAULT)
 
 # Wipe all test-relevant folders
 for name in ["Needs_Action", "In_Progress", "Done", "Pending_Approval", "Approved", "Rejected"]:
-    for f in folders[name].glob("*.md"):
-        f.unlink()
+    for entry in _scan_md(folders[name]):
+        os.unlink(entry.path)
 
 # Clean test artifacts from Plans/ and Logs/
-for f in folders["Plans"].glob("PLAN_TEST*"):
-    f.unlink()
+for entry in _iter_prefix(folders["Plans"], "PLAN_TEST"):
+    os.unlink(entry.path)
 for f in folders["Logs"].glob("*"):
     if f.is_file():
         try:
@@ -145,7 +167,7 @@ whatsapp_file.write_text(whatsapp_content, encoding="utf-8")
 check("EMAIL_test001.md created", email_file.exists())
 check("STRIPE_ch_test002.md created", stripe_file.exists())
 check("WHATSAPP_test_john.md created", whatsapp_file.exists())
-na_count = len(list(folders["Needs_Action"].glob("*.md")))
+na_count = len(_scan_md(folders["Needs_Action"]))
 check("Needs_Action/ has 3 files", na_count == 3, f"found {na_count}")
 
 # ==================================================================
@@ -160,8 +182,8 @@ check("EMAIL moved to In_Progress/", moved_email.exists(), moved_email.name)
 check("STRIPE moved to In_Progress/", moved_stripe.exists(), moved_stripe.name)
 check("WHATSAPP moved to In_Progress/", moved_whatsapp.exists(), moved_whatsapp.name)
 
-na_after = len(list(folders["Needs_Action"].glob("*.md")))
-ip_after = len(list(folders["In_Progress"].glob("*.md")))
+na_after = len(_scan_md(folders["Needs_Action"]))
+ip_after = len(_scan_md(folders["In_Progress"]))
 check("Needs_Action/ is empty", na_after == 0, f"{na_after} remaining")
 check("In_Progress/ has 3 files", ip_after == 3, f"{ip_after} found")
 
@@ -219,7 +241,7 @@ Payment $750 received. Confirm thank-you email.
 """, encoding="utf-8")
 check("Pending approval (bob) created", approval_stripe.exists())
 
-pa_count = len(list(folders["Pending_Approval"].glob("*.md")))
+pa_count = len(_scan_md(folders["Pending_Approval"]))
 check("Pending_Approval/ has 2 files", pa_count == 2, f"found {pa_count}")
 
 # ==================================================================
@@ -259,7 +281,7 @@ if success and approved_alice.exists():
 
 # Write success log
 _log_action_result(folders, approved_alice, "SUCCESS", "send_email", "DRY RUN: would send to alice@example.com")
-success_logs = list(folders["Logs"].glob("ACTION_SUCCESS_*alice*"))
+success_logs = list(_iter_prefix(folders["Logs"], "ACTION_SUCCESS_", "alice"))
 check("ACTION_SUCCESS log created", len(success_logs) > 0)
 
 # ==================================================================
@@ -307,7 +329,7 @@ meta_li = parse_frontmatter(linkedin_file)
 li_success = _action_placeholder(linkedin_file, meta_li, folders, dry_run=True)
 check("Placeholder returned success (graceful)", li_success)
 
-manual_tasks = list(folders["Needs_Action"].glob("MANUAL_*linkedin*"))
+manual_tasks = list(_iter_prefix(folders["Needs_Action"], "MANUAL_", "linkedin"))
 check("Manual task created in Needs_Action/", len(manual_tasks) > 0)
 
 if linkedin_file.exists():
@@ -369,10 +391,10 @@ check("Error folder created", error_dest.parent.name.startswith("Error_"))
 section("TEST 10: Move completed tasks to Done/ for briefing")
 # ==================================================================
 
-for f in folders["In_Progress"].glob("*.md"):
-    move_file(f, folders["Done"])
+for entry in _scan_md(folders["In_Progress"]):
+    move_file(Path(entry.path), folders["Done"])
 
-done_count = len(list(folders["Done"].glob("*.md")))
+done_count = len(_scan_md(folders["Done"]))
 check("All tasks in Done/", done_count >= 3, f"{done_count} files")
 
 # ==================================================================
@@ -415,14 +437,10 @@ check("Dashboard has Recent Activity", "Recent Activity" in dash)
 section("FINAL VAULT STATE")
 # ==================================================================
 
-for name in ["Needs_Action", "In_Progress", "Done", "Pending_Approval",
-             "Approved", "Rejected", "Plans", "Logs", "Briefings"]:
-    folder = folders[name]
-    count = sum(1 for _ in folder.glob("*.md"))
+for name in ("Needs_Action", "In_Progress", "Done", "Pending_Approval",
+             "Approved", "Rejected", "Plans", "Logs", "Briefings"):
     # Also count in subdirs (Logs/Error_*)
-    for sub in folder.iterdir():
-        if sub.is_dir():
-            count += sum(1 for _ in sub.glob("*.md"))
+    count = count_md(str(folders[name]), depth=1)
     safe_print(f"  {name + '/':.<25} {count} file(s)")
 
 # ==================================================================
@@ -29,13 +29,20 @@ SCHEDULING
 """
 
 import argparse
+import functools
+import io
 import logging
 import os
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import repeat
 from pathlib import Path
+from time import localtime, strftime
+from typing import TextIO
 
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
@@ -46,75 +53,273 @@ logger = logging.getLogger("WeeklyBriefing")
 # Frontmatter parser (same logic as task_processor.py)
 # ------------------------------------------------------------------
 
-def parse_frontmatter(file_path: Path) -> dict[str, str]:
-    """Extract YAML frontmatter key-value pairs from a markdown file."""
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)", re.DOTALL)
+
+# Parsed headers kept in-process, keyed by path and st_mtime_ns so any
+# write to a file changes its key
+HEADER_CACHE_SIZE = 4096
+
+
+def parse_frontmatter(file_path: Path | str, keys_only: bool = False) -> dict[str, str]:
+    """Extract YAML frontmatter key-value pairs from a markdown file.
+
+    With *keys_only*, reading stops at the closing --- line and the body
+    is not kept under '__body__'; the result is cached until the file's
+    mtime changes.
+    """
+    if keys_only:
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return {}
+        return dict(_cached_header(os.fspath(file_path), mtime_ns))
+
     try:
-        text = file_path.read_text(encoding="utf-8")
+        with open(file_path, encoding="utf-8") as f:
+            text = f.read()
     except Exception:
         return {}
 
     meta: dict[str, str] = {}
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n?(.*)", text, re.DOTALL)
+    match = FRONTMATTER_RE.match(text)
     if not match:
         meta["__body__"] = text
         return meta
 
     yaml_block, body = match.group(1), match.group(2)
     meta["__body__"] = body.strip()
+    _parse_yaml_lines(yaml_block.splitlines(), meta)
+    return meta
+
+
+def _parse_header(file_path: Path | str) -> dict[str, str]:
+    """Read lines only up to the closing --- and parse the keys above it."""
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            if f.readline().rstrip() != "---":
+                return {}
+            lines: list[str] = []
+            for line in f:
+                if line.startswith("---"):
+                    meta: dict[str, str] = {}
+                    _parse_yaml_lines(lines, meta)
+                    return meta
+                lines.append(line)
+    except Exception:
+        pass
+    return {}
+
+
+@functools.lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _cached_header(path: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    """_parse_header() of *path* as it was at *mtime_ns*, frozen so the
+    cached copy cannot be changed by a caller."""
+    return tuple(_parse_header(path).items())
 
-    for line in yaml_block.splitlines():
+
+def _parse_yaml_lines(lines: list[str], meta: dict[str, str]) -> None:
+    """Add the key: value pairs in *lines* to *meta*."""
+    meta_set = meta.__setitem__
+    for line in lines:
         line = line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
-        colon_idx = line.find(":")
-        if colon_idx == -1:
+        key, sep, value = line.partition(":")
+        if not sep:
             continue
-        key = line[:colon_idx].strip()
-        value = line[colon_idx + 1:].strip()
-        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
             value = value[1:-1]
-        meta[key] = value
-
-    return meta
+        meta_set(key.rstrip(), value)
 
 
 # ------------------------------------------------------------------
 # File scanning
 # ------------------------------------------------------------------
 
-def get_md_files(folder: Path, since: datetime) -> list[tuple[Path, datetime]]:
-    """Return .md files in *folder* modified since *since*, with their mtime."""
-    if not folder.is_dir():
+def list_md_files(
+    folder: Path, recurse: bool = False
+) -> list[tuple[str, float, str | None]]:
+    """Return every .md file in *folder* as (path, mtime, subdir) tuples,
+    where subdir is the subdirectory name, or None for files directly in
+    *folder*.  With *recurse*, one level of subdirectories is included
+    too — only Logs/ has them (Logs/Error_*/).
+
+    One os.scandir pass per directory; entry types come from the listing
+    and mtimes stay raw floats, so callers build Path objects and format
+    times only for the files they keep.
+    """
+    results: list[tuple[str, float, str | None]] = []
+    subdirs: list[os.DirEntry] = []
+    try:
+        it = os.scandir(folder)
+    except (FileNotFoundError, NotADirectoryError):
         return []
+    with it:
+        for entry in it:
+            if recurse and entry.is_dir():
+                subdirs.append(entry)
+            elif entry.name.endswith(".md") and entry.is_file():
+                results.append((entry.path, entry.stat().st_mtime, None))
+
+    for sub in subdirs:
+        with os.scandir(sub.path) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and entry.is_file():
+                    results.append((entry.path, entry.stat().st_mtime, sub.name))
+
+    return results
+
+
+def get_md_files(
+    folder: Path, since: datetime, recurse: bool = False
+) -> list[tuple[Path, float]]:
+    """Return .md files in *folder* modified since *since*, newest first,
+    with their raw st_mtime."""
+    cutoff = since.timestamp()
+    results = [
+        (Path(path), mtime)
+        for path, mtime, _ in list_md_files(folder, recurse)
+        if mtime >= cutoff
+    ]
+    return sorted(results, key=lambda x: x[1], reverse=True)
 
-    results: list[tuple[Path, datetime]] = []
-    for f in folder.glob("*.md"):
-        mtime = datetime.fromtimestamp(f.stat().st_mtime)
-        if mtime >= since:
-            results.append((f, mtime))
 
-    # Also scan one level of subdirectories (e.g. Logs/Error_*/)
-    for sub in folder.iterdir():
-        if sub.is_dir():
-            for f in sub.glob("*.md"):
-                mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                if mtime >= since:
-                    results.append((f, mtime))
+# Times shown in the briefing tables
+TIME_FORMAT = "%Y-%m-%d %H:%M"
 
-    return sorted(results, key=lambda x: x[1], reverse=True)
+
+def format_mtime(mtime: float) -> str:
+    """Format a raw st_mtime for display — called once per listed record.
+
+    time.strftime on a struct_time skips building a datetime per record.
+    """
+    return strftime(TIME_FORMAT, localtime(mtime))
+
+
+def list_md_entries(folder: Path) -> list[os.DirEntry]:
+    """Return the .md files directly in *folder* as os.DirEntry objects —
+    name and path without a Path object or a stat call per file."""
+    try:
+        with os.scandir(folder) as it:
+            return [e for e in it if e.name.endswith(".md") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def count_all_files(folder: Path) -> int:
     """Count all .md files in a folder (non-recursive)."""
-    if not folder.is_dir():
+    try:
+        with os.scandir(folder) as it:
+            return sum(1 for e in it if e.name.endswith(".md") and e.is_file())
+    except (FileNotFoundError, NotADirectoryError):
         return 0
-    return sum(1 for _ in folder.glob("*.md"))
+
+
+# ------------------------------------------------------------------
+# Briefing records
+# ------------------------------------------------------------------
+# One small slotted class per table row — thousands of these are cheaper
+# than the equivalent dicts, and the renderer reads plain attributes.
+
+@dataclass(slots=True)
+class CompletedTask:
+    file: str
+    type: str
+    completed: str
+    subject: str
+
+
+@dataclass(slots=True)
+class PendingTask:
+    file: str
+    type: str
+    priority: str
+    sender: str
+
+
+@dataclass(slots=True)
+class InProgressTask:
+    file: str
+    type: str
+    sender: str
+
+
+@dataclass(slots=True)
+class PendingApproval:
+    file: str
+    action_type: str
+    to: str
+    amount: str
+
+
+@dataclass(slots=True)
+class Approval:
+    file: str
+    action_type: str
+    approved: str
+
+
+@dataclass(slots=True)
+class Rejection:
+    file: str
+    rejected: str
+
+
+@dataclass(slots=True)
+class ActionLogEntry:
+    file: str
+    action_type: str
+    time: str
+
+
+@dataclass(slots=True)
+class ErrorEntry:
+    file: str
+    folder: str
+    time: str
+
+
+@dataclass(slots=True)
+class Payment:
+    file: str
+    amount: str
+    customer: str
 
 
 # ------------------------------------------------------------------
 # Data aggregation
 # ------------------------------------------------------------------
 
+# Parses "$1,234.56 USD" → "1,234.56"
+AMOUNT_RE = re.compile(r"\$?([\d,]+\.?\d*)")
+
+# Threads reading and parsing files at once (the work is I/O-bound)
+PARSE_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Bytes sniffed to spot a payment file — stripe_watcher.py writes
+# "type: stripe_payment" on the line right after the opening ---
+PAYMENT_SNIFF_BYTES = 512
+
+
+def _is_stripe_payment(file_path: Path) -> bool:
+    """Cheap pre-check: does the head of *file_path* mention stripe_payment?"""
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(PAYMENT_SNIFF_BYTES)
+    except OSError:
+        return False
+    return b"stripe_payment" in head
+
+
+def _parse_listed_or_payment(file_path: Path, listed: bool) -> dict[str, str]:
+    """Parse *file_path* if it is listed in the briefing; otherwise it only
+    matters to the revenue tally, so parse it only if it sniffs as a payment."""
+    if listed or _is_stripe_payment(file_path):
+        return parse_frontmatter(file_path, keys_only=True)
+    return {}
+
+
 class BriefingData:
     """Collects and holds all metrics for the briefing."""
 
@@ -123,7 +328,13 @@ class BriefingData:
         self.since = since
         self.now = datetime.now()
 
-        # Folder references
+        # Folder references — only the folders that exist, found with one
+        # listing of the vault instead of a lookup per folder
+        try:
+            with os.scandir(vault) as it:
+                existing = {e.name for e in it if e.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            existing = set()
         self.folders = {
             name: vault / name
             for name in [
@@ -131,23 +342,24 @@ class BriefingData:
                 "Pending_Approval", "Approved", "Rejected",
                 "Accounting", "Logs", "Briefings", "Updates",
             ]
+            if name in existing
         }
 
         # Aggregated metrics
-        self.tasks_completed: list[dict] = []
-        self.tasks_pending: list[dict] = []
-        self.tasks_in_progress: list[dict] = []
-        self.tasks_awaiting_approval: list[dict] = []
-        self.approvals: list[dict] = []
-        self.rejections: list[dict] = []
-        self.action_successes: list[dict] = []
-        self.action_failures: list[dict] = []
-        self.errors: list[dict] = []
+        self.tasks_completed: list[CompletedTask] = []
+        self.tasks_pending: list[PendingTask] = []
+        self.tasks_in_progress: list[InProgressTask] = []
+        self.tasks_awaiting_approval: list[PendingApproval] = []
+        self.approvals: list[Approval] = []
+        self.rejections: list[Rejection] = []
+        self.action_successes: list[ActionLogEntry] = []
+        self.action_failures: list[ActionLogEntry] = []
+        self.errors: list[ErrorEntry] = []
 
         # Financial
         self.total_revenue_cents: int = 0
         self.payment_count: int = 0
-        self.payments: list[dict] = []
+        self.payments: list[Payment] = []
 
         # Source breakdown
         self.source_counts: Counter = Counter()
@@ -156,189 +368,268 @@ class BriefingData:
         self._scan()
 
     def _scan(self) -> None:
-        """Walk through every vault folder and aggregate data."""
-        self._scan_done()
-        self._scan_needs_action()
-        self._scan_in_progress()
-        self._scan_pending_approval()
-        self._scan_approved()
-        self._scan_rejected()
-        self._scan_logs()
-        self._scan_done_for_financials()
+        """Walk through every vault folder once and aggregate data.
+
+        Done/ and Approved/ feed both their activity lists and the revenue
+        tally from the same pass, so no file is listed or parsed twice.
+        Frontmatter is parsed on a thread pool shared by all scans.  Scans
+        of folders missing from the vault are skipped.
+        """
+        scans = (
+            ("Done", self._scan_done),
+            ("Needs_Action", self._scan_needs_action),
+            ("In_Progress", self._scan_in_progress),
+            ("Pending_Approval", self._scan_pending_approval),
+            ("Approved", self._scan_approved),
+            ("Rejected", self._scan_rejected),
+            ("Logs", self._scan_logs),
+        )
+        with ThreadPoolExecutor(PARSE_WORKERS, thread_name_prefix="briefing") as pool:
+            self._pool = pool
+            for name, scan in scans:
+                if name in self.folders:
+                    scan()
+        del self._pool
+
+    def _parse_batch(self, files: list[Path] | list[str]) -> list[dict[str, str]]:
+        """Parse the frontmatter keys of *files* in parallel, in their order.
+
+        No scan reads the body, so only the header of each file is read.
+        """
+        return list(self._pool.map(parse_frontmatter, files, repeat(True)))
+
+    def _recent_and_payments(self, folder: Path) -> list[tuple[Path, float, dict[str, str]]]:
+        """Tally stripe payments in *folder* and return the files modified
+        since self.since (newest first) with their parsed frontmatter.
+
+        Revenue is deliberately not windowed: every payment file in
+        *folder* counts, as it always has.  Only the activity
+        lists are limited to the period, so older files are sniffed and
+        only the payments among them are parsed.
+        """
+        cutoff = self.since.timestamp()
+        files = [(Path(path), mtime) for path, mtime, _ in list_md_files(folder)]
+        metas = self._pool.map(
+            _parse_listed_or_payment,
+            [f for f, _ in files],
+            [mtime >= cutoff for _, mtime in files],
+        )
+
+        recent: list[tuple[Path, float, dict[str, str]]] = []
+        for (f, mtime), meta in zip(files, metas):
+            self._tally_payment(f, meta)
+            if mtime >= cutoff:
+                recent.append((f, mtime, meta))
+        recent.sort(key=lambda x: x[1], reverse=True)
+        return recent
 
     def _scan_done(self) -> None:
-        for f, mtime in get_md_files(self.folders["Done"], self.since):
-            meta = parse_frontmatter(f)
+        for f, mtime, meta in self._recent_and_payments(self.folders["Done"]):
             task_type = meta.get("type", "unknown")
-            self.tasks_completed.append({
-                "file": f.name,
-                "type": task_type,
-                "completed": mtime.strftime("%Y-%m-%d %H:%M"),
-                "subject": meta.get("subject", meta.get("from", f.stem)),
-            })
+            self.tasks_completed.append(CompletedTask(
+                file=f.name,
+                type=task_type,
+                completed=format_mtime(mtime),
+                subject=meta.get("subject", meta.get("from", f.stem)),
+            ))
             self.source_counts[task_type] += 1
 
     def _scan_needs_action(self) -> None:
-        for f in self.folders["Needs_Action"].glob("*.md"):
-            meta = parse_frontmatter(f)
-            self.tasks_pending.append({
-                "file": f.name,
-                "type": meta.get("type", "unknown"),
-                "priority": meta.get("priority", "medium"),
-                "from": meta.get("from", ""),
-            })
+        entries = list_md_entries(self.folders["Needs_Action"])
+        for f, meta in zip(entries, self._parse_batch([e.path for e in entries])):
+            self.tasks_pending.append(PendingTask(
+                file=f.name,
+                type=meta.get("type", "unknown"),
+                priority=meta.get("priority", "medium"),
+                sender=meta.get("from", ""),
+            ))
 
     def _scan_in_progress(self) -> None:
-        for f in self.folders["In_Progress"].glob("*.md"):
-            meta = parse_frontmatter(f)
-            self.tasks_in_progress.append({
-                "file": f.name,
-                "type": meta.get("type", "unknown"),
-                "from": meta.get("from", ""),
-            })
+        entries = list_md_entries(self.folders["In_Progress"])
+        for f, meta in zip(entries, self._parse_batch([e.path for e in entries])):
+            self.tasks_in_progress.append(InProgressTask(
+                file=f.name,
+                type=meta.get("type", "unknown"),
+                sender=meta.get("from", ""),
+            ))
 
     def _scan_pending_approval(self) -> None:
-        for f in self.folders["Pending_Approval"].glob("*.md"):
-            meta = parse_frontmatter(f)
-            self.tasks_awaiting_approval.append({
-                "file": f.name,
-                "action_type": meta.get("action_type", "unknown"),
-                "to": meta.get("to", ""),
-                "amount": meta.get("amount", ""),
-            })
+        entries = list_md_entries(self.folders["Pending_Approval"])
+        for f, meta in zip(entries, self._parse_batch([e.path for e in entries])):
+            self.tasks_awaiting_approval.append(PendingApproval(
+                file=f.name,
+                action_type=meta.get("action_type", "unknown"),
+                to=meta.get("to", ""),
+                amount=meta.get("amount", ""),
+            ))
 
     def _scan_approved(self) -> None:
-        for f, mtime in get_md_files(self.folders["Approved"], self.since):
-            meta = parse_frontmatter(f)
-            self.approvals.append({
-                "file": f.name,
-                "action_type": meta.get("action_type", ""),
-                "approved": mtime.strftime("%Y-%m-%d %H:%M"),
-            })
+        # Stripe payments here count too (processed but maybe not moved yet)
+        for f, mtime, meta in self._recent_and_payments(self.folders["Approved"]):
+            self.approvals.append(Approval(
+                file=f.name,
+                action_type=meta.get("action_type", ""),
+                approved=format_mtime(mtime),
+            ))
 
     def _scan_rejected(self) -> None:
         for f, mtime in get_md_files(self.folders["Rejected"], self.since):
-            meta = parse_frontmatter(f)
-            self.rejections.append({
-                "file": f.name,
-                "rejected": mtime.strftime("%Y-%m-%d %H:%M"),
-            })
+            self.rejections.append(Rejection(
+                file=f.name,
+                rejected=format_mtime(mtime),
+            ))
 
     def _scan_logs(self) -> None:
-        for f, mtime in get_md_files(self.folders["Logs"], self.since):
-            meta = parse_frontmatter(f)
-            log_type = meta.get("type", "")
-
-            if log_type == "action_log":
-                entry = {
-                    "file": f.name,
-                    "action_type": meta.get("action_type", ""),
-                    "time": mtime.strftime("%Y-%m-%d %H:%M"),
-                }
-                if meta.get("result") == "success":
-                    self.action_successes.append(entry)
-                else:
-                    self.action_failures.append(entry)
-
-            if "Error_" in str(f.parent.name):
-                self.errors.append({
-                    "file": f.name,
-                    "folder": f.parent.name,
-                    "time": mtime.strftime("%Y-%m-%d %H:%M"),
-                })
-
-    def _scan_done_for_financials(self) -> None:
-        """Look for stripe_payment files in Done/ to tally revenue."""
-        for f in self.folders["Done"].glob("*.md"):
-            meta = parse_frontmatter(f)
-            if meta.get("type") != "stripe_payment":
-                continue
-
-            amount_str = meta.get("amount", "")
-            # Parse "$1,234.56 USD" → cents
-            amount_match = re.search(r"\$?([\d,]+\.?\d*)", amount_str)
-            if amount_match:
-                try:
-                    dollars = float(amount_match.group(1).replace(",", ""))
-                    cents = int(dollars * 100)
-                    self.total_revenue_cents += cents
-                    self.payment_count += 1
-                    self.payments.append({
-                        "file": f.name,
-                        "amount": amount_str,
-                        "customer": meta.get("customer", "Unknown"),
-                    })
-                except ValueError:
-                    pass
-
-        # Also check Approved/ stripe payments (processed but maybe not moved yet)
-        for f in self.folders["Approved"].glob("*.md"):
-            meta = parse_frontmatter(f)
-            if meta.get("type") != "stripe_payment":
-                continue
-            amount_str = meta.get("amount", "")
-            amount_match = re.search(r"\$?([\d,]+\.?\d*)", amount_str)
-            if amount_match:
-                try:
-                    dollars = float(amount_match.group(1).replace(",", ""))
-                    cents = int(dollars * 100)
-                    self.total_revenue_cents += cents
-                    self.payment_count += 1
-                    self.payments.append({
-                        "file": f.name,
-                        "amount": amount_str,
-                        "customer": meta.get("customer", "Unknown"),
-                    })
-                except ValueError:
-                    pass
+        cutoff = self.since.timestamp()
+        files = sorted(
+            ((Path(path), mtime, subdir)
+             for path, mtime, subdir in list_md_files(self.folders["Logs"], recurse=True)
+             if mtime >= cutoff),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        # The error-folder test depends only on the subdirectory, so run it
+        # once per Logs/ subdir; files directly in Logs/ are never errors
+        error_dirs = {
+            subdir for subdir in {x[2] for x in files}
+            if subdir is not None and "Error_" in subdir
+        }
+        # Only Logs/ACTION_*.md files carry an action_log header
+        metas = iter(self._parse_batch([x[0] for x in files if x[0].name.startswith("ACTION_")]))
+        for f, mtime, subdir in files:
+            if f.name.startswith("ACTION_"):
+                meta = next(metas)
+                if meta.get("type", "") == "action_log":
+                    entry = ActionLogEntry(
+                        file=f.name,
+                        action_type=meta.get("action_type", ""),
+                        time=format_mtime(mtime),
+                    )
+                    if meta.get("result") == "success":
+                        self.action_successes.append(entry)
+                    else:
+                        self.action_failures.append(entry)
+
+            if subdir in error_dirs:
+                self.errors.append(ErrorEntry(
+                    file=f.name,
+                    folder=subdir,
+                    time=format_mtime(mtime),
+                ))
+
+    def _tally_payment(self, f: Path, meta: dict[str, str]) -> None:
+        """Add a stripe_payment file's amount to the revenue totals."""
+        if meta.get("type") != "stripe_payment":
+            return
+
+        amount_str = meta.get("amount", "")
+        amount_match = AMOUNT_RE.search(amount_str)
+        if amount_match:
+            # Whole dollars and cents as integers — exact, unlike
+            # float("19.99") * 100 == 1998.99...
+            whole, _, frac = amount_match.group(1).replace(",", "").partition(".")
+            try:
+                cents = int(whole) * 100 + int((frac + "00")[:2])
+                self.total_revenue_cents += cents
+                self.payment_count += 1
+                self.payments.append(Payment(
+                    file=f.name,
+                    amount=amount_str,
+                    customer=meta.get("customer", "Unknown"),
+                ))
+            except ValueError:
+                pass
 
 
 # ------------------------------------------------------------------
 # Briefing renderer
 # ------------------------------------------------------------------
 
+# Fixed blocks of the briefing — each is written with a single call,
+# including the whole of a section when it has nothing to list
+_EXEC_SUMMARY_HEADER = (
+    "## Executive Summary\n"
+    "\n"
+    "| Metric | Value |\n"
+    "|--------|-------|\n"
+)
+_NO_ALERTS = (
+    "## Alerts\n"
+    "\n"
+    "No alerts — all metrics within normal range.\n"
+    "\n"
+)
+_NO_TASKS_COMPLETED = (
+    "## Tasks Completed\n"
+    "\n"
+    "No tasks completed this period.\n"
+    "\n"
+)
+_NO_PAYMENTS = (
+    "## Revenue & Payments\n"
+    "\n"
+    "No payments recorded this period.\n"
+    "\n"
+)
+_FOOTER_CHECKLIST = (
+    "- [ ] Verify `Dashboard.md` metrics are current\n"
+    "- [ ] Update `Business_Goals.md` if targets have changed\n"
+    "- [ ] Review `Accounting/` records for completeness\n"
+)
+
+
 def render_briefing(data: BriefingData) -> str:
     """Render the collected data into a markdown briefing document."""
+    buf = io.StringIO()
+    write_briefing(data, buf)
+    return buf.getvalue()
+
+
+def write_briefing(data: BriefingData, out: TextIO) -> None:
+    """Write the briefing document to the text stream *out*.
+
+    Every string written ends with its own newline, so fixed headings and
+    empty sections go out in one write() each, and each table body is
+    joined into one string before it is written.
+    """
     period_start = data.since.strftime("%Y-%m-%d")
     period_end = data.now.strftime("%Y-%m-%d")
     generated = data.now.strftime("%Y-%m-%d %H:%M:%S")
     revenue_dollars = data.total_revenue_cents / 100
 
-    lines: list[str] = []
-
-    def add(text: str = "") -> None:
-        lines.append(text)
+    write = out.write
 
     # ---- Header ----
-    add("---")
-    add("type: weekly_briefing")
-    add(f"period_start: {period_start}")
-    add(f"period_end: {period_end}")
-    add(f"generated: {generated}")
-    add("---")
-    add()
-    add(f"# Weekly CEO Briefing")
-    add(f"**Period:** {period_start} → {period_end}")
-    add(f"**Generated:** {generated}")
-    add()
+    write(
+        f"---\n"
+        f"type: weekly_briefing\n"
+        f"period_start: {period_start}\n"
+        f"period_end: {period_end}\n"
+        f"generated: {generated}\n"
+        f"---\n"
+        f"\n"
+        f"# Weekly CEO Briefing\n"
+        f"**Period:** {period_start} → {period_end}\n"
+        f"**Generated:** {generated}\n"
+        f"\n"
+    )
 
     # ---- Executive Summary ----
-    add("## Executive Summary")
-    add()
-    add(f"| Metric | Value |")
-    add(f"|--------|-------|")
-    add(f"| Tasks Completed | {len(data.tasks_completed)} |")
-    add(f"| Tasks Pending | {len(data.tasks_pending)} |")
-    add(f"| Tasks In Progress | {len(data.tasks_in_progress)} |")
-    add(f"| Awaiting Approval | {len(data.tasks_awaiting_approval)} |")
-    add(f"| Approvals Given | {len(data.approvals)} |")
-    add(f"| Rejections | {len(data.rejections)} |")
-    add(f"| Actions Executed | {len(data.action_successes)} |")
-    add(f"| Action Failures | {len(data.action_failures)} |")
-    add(f"| Errors | {len(data.errors)} |")
-    add(f"| Revenue This Period | ${revenue_dollars:,.2f} |")
-    add(f"| Payments Received | {data.payment_count} |")
-    add()
+    write(_EXEC_SUMMARY_HEADER)
+    write(
+        f"| Tasks Completed | {len(data.tasks_completed)} |\n"
+        f"| Tasks Pending | {len(data.tasks_pending)} |\n"
+        f"| Tasks In Progress | {len(data.tasks_in_progress)} |\n"
+        f"| Awaiting Approval | {len(data.tasks_awaiting_approval)} |\n"
+        f"| Approvals Given | {len(data.approvals)} |\n"
+        f"| Rejections | {len(data.rejections)} |\n"
+        f"| Actions Executed | {len(data.action_successes)} |\n"
+        f"| Action Failures | {len(data.action_failures)} |\n"
+        f"| Errors | {len(data.errors)} |\n"
+        f"| Revenue This Period | ${revenue_dollars:,.2f} |\n"
+        f"| Payments Received | {data.payment_count} |\n"
+        f"\n"
+    )
 
     # ---- Alerts ----
     alerts: list[str] = []
@@ -354,139 +645,139 @@ def render_briefing(data: BriefingData) -> str:
         alerts.append(f"- **Revenue below target:** ${revenue_dollars:,.2f} (target: $2,500/week)")
 
     if alerts:
-        add("## Alerts")
-        add()
-        for a in alerts:
-            add(a)
-        add()
+        write("## Alerts\n\n")
+        write("".join(f"{a}\n" for a in alerts))
+        write("\n")
     else:
-        add("## Alerts")
-        add()
-        add("No alerts — all metrics within normal range.")
-        add()
+        write(_NO_ALERTS)
 
     # ---- Tasks Completed ----
-    add("## Tasks Completed")
-    add()
     if data.tasks_completed:
-        add("| File | Type | Completed |")
-        add("|------|------|-----------|")
-        for t in data.tasks_completed[:25]:
-            add(f"| {t['file']} | {t['type']} | {t['completed']} |")
+        write(
+            "## Tasks Completed\n"
+            "\n"
+            "| File | Type | Completed |\n"
+            "|------|------|-----------|\n"
+        )
+        write("".join(
+            f"| {t.file} | {t.type} | {t.completed} |\n"
+            for t in data.tasks_completed[:25]
+        ))
         if len(data.tasks_completed) > 25:
-            add(f"| ... | +{len(data.tasks_completed) - 25} more | |")
+            write(f"| ... | +{len(data.tasks_completed) - 25} more | |\n")
+        write("\n")
     else:
-        add("No tasks completed this period.")
-    add()
+        write(_NO_TASKS_COMPLETED)
 
     # ---- Source Breakdown ----
     if data.source_counts:
-        add("## Task Sources")
-        add()
-        add("| Source | Count |")
-        add("|--------|-------|")
-        for source, count in data.source_counts.most_common():
-            add(f"| {source} | {count} |")
-        add()
+        write(
+            "## Task Sources\n"
+            "\n"
+            "| Source | Count |\n"
+            "|--------|-------|\n"
+        )
+        write("".join(
+            f"| {source} | {count} |\n"
+            for source, count in data.source_counts.most_common()
+        ))
+        write("\n")
 
     # ---- Revenue / Payments ----
-    add("## Revenue & Payments")
-    add()
     if data.payments:
-        add(f"**Total Revenue:** ${revenue_dollars:,.2f} from {data.payment_count} payment(s)")
-        add()
-        add("| Customer | Amount |")
-        add("|----------|--------|")
-        for p in data.payments[:20]:
-            add(f"| {p['customer']} | {p['amount']} |")
+        write(
+            f"## Revenue & Payments\n"
+            f"\n"
+            f"**Total Revenue:** ${revenue_dollars:,.2f} from {data.payment_count} payment(s)\n"
+            f"\n"
+            f"| Customer | Amount |\n"
+            f"|----------|--------|\n"
+        )
+        write("".join(f"| {p.customer} | {p.amount} |\n" for p in data.payments[:20]))
+        write("\n")
     else:
-        add("No payments recorded this period.")
-    add()
+        write(_NO_PAYMENTS)
 
     # ---- Pending Items (need CEO action) ----
     if data.tasks_awaiting_approval:
-        add("## Awaiting Your Approval")
-        add()
-        add("| File | Action | Details |")
-        add("|------|--------|---------|")
-        for t in data.tasks_awaiting_approval:
-            detail = t.get("to") or t.get("amount") or ""
-            add(f"| {t['file']} | {t['action_type']} | {detail} |")
-        add()
+        write(
+            "## Awaiting Your Approval\n"
+            "\n"
+            "| File | Action | Details |\n"
+            "|------|--------|---------|\n"
+        )
+        write("".join(
+            f"| {t.file} | {t.action_type} | {t.to or t.amount} |\n"
+            for t in data.tasks_awaiting_approval
+        ))
+        write("\n")
 
     if data.tasks_pending:
-        add("## Backlog (Needs_Action/)")
-        add()
-        add("| File | Type | Priority |")
-        add("|------|------|----------|")
-        for t in data.tasks_pending[:15]:
-            add(f"| {t['file']} | {t['type']} | {t['priority']} |")
+        write(
+            "## Backlog (Needs_Action/)\n"
+            "\n"
+            "| File | Type | Priority |\n"
+            "|------|------|----------|\n"
+        )
+        write("".join(
+            f"| {t.file} | {t.type} | {t.priority} |\n"
+            for t in data.tasks_pending[:15]
+        ))
         if len(data.tasks_pending) > 15:
-            add(f"| ... | +{len(data.tasks_pending) - 15} more | |")
-        add()
+            write(f"| ... | +{len(data.tasks_pending) - 15} more | |\n")
+        write("\n")
 
     if data.tasks_in_progress:
-        add("## In Progress")
-        add()
-        add("| File | Type |")
-        add("|------|------|")
-        for t in data.tasks_in_progress:
-            add(f"| {t['file']} | {t['type']} |")
-        add()
+        write(
+            "## In Progress\n"
+            "\n"
+            "| File | Type |\n"
+            "|------|------|\n"
+        )
+        write("".join(f"| {t.file} | {t.type} |\n" for t in data.tasks_in_progress))
+        write("\n")
 
     # ---- Failures / Errors ----
     if data.action_failures or data.errors:
-        add("## Issues Requiring Attention")
-        add()
+        write("## Issues Requiring Attention\n\n")
         if data.action_failures:
-            add("### Action Failures")
-            add()
-            for f in data.action_failures:
-                add(f"- `{f['file']}` — {f['action_type']} at {f['time']}")
-            add()
+            write("### Action Failures\n\n")
+            write("".join(
+                f"- `{f.file}` — {f.action_type} at {f.time}\n"
+                for f in data.action_failures
+            ))
+            write("\n")
         if data.errors:
-            add("### Processing Errors")
-            add()
-            for e in data.errors:
-                add(f"- `{e['folder']}/{e['file']}` at {e['time']}")
-            add()
+            write("### Processing Errors\n\n")
+            write("".join(f"- `{e.folder}/{e.file}` at {e.time}\n" for e in data.errors))
+            write("\n")
 
     # ---- Approvals & Rejections Log ----
     if data.approvals or data.rejections:
-        add("## Decisions Log")
-        add()
+        write("## Decisions Log\n\n")
         if data.approvals:
-            add("### Approved")
-            add()
-            for a in data.approvals:
-                add(f"- `{a['file']}` ({a['action_type'] or 'general'}) — {a['approved']}")
-            add()
+            write("### Approved\n\n")
+            write("".join(
+                f"- `{a.file}` ({a.action_type or 'general'}) — {a.approved}\n"
+                for a in data.approvals
+            ))
+            write("\n")
         if data.rejections:
-            add("### Rejected")
-            add()
-            for r in data.rejections:
-                add(f"- `{r['file']}` — {r['rejected']}")
-            add()
+            write("### Rejected\n\n")
+            write("".join(f"- `{r.file}` — {r.rejected}\n" for r in data.rejections))
+            write("\n")
 
     # ---- Footer ----
-    add("---")
-    add()
-    add("## Recommended Actions This Week")
-    add()
+    write("---\n\n## Recommended Actions This Week\n\n")
     if data.tasks_awaiting_approval:
-        add(f"- [ ] Review {len(data.tasks_awaiting_approval)} item(s) in `Pending_Approval/`")
+        write(f"- [ ] Review {len(data.tasks_awaiting_approval)} item(s) in `Pending_Approval/`\n")
     if data.tasks_pending:
-        add(f"- [ ] Clear {len(data.tasks_pending)} task(s) from `Needs_Action/` backlog")
+        write(f"- [ ] Clear {len(data.tasks_pending)} task(s) from `Needs_Action/` backlog\n")
     if data.action_failures:
-        add("- [ ] Investigate failed actions in `Logs/ACTION_FAILED_*`")
+        write("- [ ] Investigate failed actions in `Logs/ACTION_FAILED_*`\n")
     if data.errors:
-        add("- [ ] Review processing errors in `Logs/Error_*/`")
-    add("- [ ] Verify `Dashboard.md` metrics are current")
-    add("- [ ] Update `Business_Goals.md` if targets have changed")
-    add("- [ ] Review `Accounting/` records for completeness")
-    add()
-
-    return "\n".join(lines)
+        write("- [ ] Review processing errors in `Logs/Error_*/`\n")
+    write(_FOOTER_CHECKLIST)
 
 
 # ------------------------------------------------------------------
@@ -496,15 +787,15 @@ def render_briefing(data: BriefingData) -> str:
 def update_dashboard(vault: Path, data: BriefingData) -> None:
     """Rewrite Dashboard.md with current metrics."""
     revenue_dollars = data.total_revenue_cents / 100
-    now = datetime.now()
+    now = data.now
 
     recent_activity: list[str] = []
     for t in data.tasks_completed[:5]:
-        recent_activity.append(f"- Completed: {t['file']} ({t['type']})")
+        recent_activity.append(f"- Completed: {t.file} ({t.type})")
     for a in data.approvals[:3]:
-        recent_activity.append(f"- Approved: {a['file']}")
+        recent_activity.append(f"- Approved: {a.file}")
     for s in data.action_successes[:3]:
-        recent_activity.append(f"- Action executed: {s['action_type']}")
+        recent_activity.append(f"- Action executed: {s.action_type}")
     if not recent_activity:
         recent_activity.append("- System ready - awaiting tasks")
 
@@ -516,9 +807,7 @@ def update_dashboard(vault: Path, data: BriefingData) -> None:
         f"**Awaiting Approval:** {len(data.tasks_awaiting_approval)}\n"
         f"**Revenue This Week:** ${revenue_dollars:,.2f}\n"
         f"**Recent Activity:**\n"
-    )
-    for item in recent_activity:
-        dashboard += f"{item}\n"
+    ) + "".join(f"{item}\n" for item in recent_activity)
 
     dash_path = vault / "Dashboard.md"
     dash_path.write_text(dashboard, encoding="utf-8")
@@ -558,32 +847,35 @@ def main() -> None:
         print(f"Error: vault path does not exist: {vault}", file=sys.stderr)
         sys.exit(1)
 
-    since = datetime.now() - timedelta(days=args.days)
-    logger.info("Generating briefing for %s → %s", since.strftime("%Y-%m-%d"), datetime.now().strftime("%Y-%m-%d"))
+    now = datetime.now()
+    since = now - timedelta(days=args.days)
+    date_str = now.strftime("%Y-%m-%d")
+    logger.info("Generating briefing for %s → %s", since.strftime("%Y-%m-%d"), date_str)
 
     # Collect data
     data = BriefingData(vault, since)
 
-    # Render
-    briefing = render_briefing(data)
-
     if args.dry_run:
-        print(briefing)
+        print(render_briefing(data))
     else:
         briefings_dir = vault / "Briefings"
         briefings_dir.mkdir(parents=True, exist_ok=True)
-        date_str = datetime.now().strftime("%Y-%m-%d")
         filename = f"BRIEFING_{date_str}.md"
-        filepath = briefings_dir / filename
 
-        # Avoid overwriting if run multiple times in a day
+        # Avoid overwriting if run multiple times in a day — one listing
+        # of Briefings/ shows every name already taken
+        with os.scandir(briefings_dir) as it:
+            prefix = f"BRIEFING_{date_str}"
+            existing = {e.name for e in it if e.name.startswith(prefix)}
         counter = 1
-        while filepath.exists():
+        while filename in existing:
             filename = f"BRIEFING_{date_str}_{counter}.md"
-            filepath = briefings_dir / filename
             counter += 1
+        filepath = briefings_dir / filename
 
-        filepath.write_text(briefing, encoding="utf-8")
+        # Render straight into the file — no intermediate document string
+        with filepath.open("w", encoding="utf-8") as out:
+            write_briefing(data, out)
         logger.info("Briefing saved: %s", filepath)
 
     # Update dashboard
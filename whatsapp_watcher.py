@@ -7,24 +7,164 @@ REQUIREMENTS
 ------------
     pip install playwright
     python -m playwright install chromium
+    pip install pyahocorasick   # optional — faster keyword matching
 
 First run must be headless=False so you can scan the QR code.
 See setup instructions at the bottom of this file.
 """
 
 import datetime
+import functools
 import json
 import logging
 import re
 import time
 from pathlib import Path
-
-from playwright.sync_api import sync_playwright, BrowserContext, Page
+from typing import Callable
+
+try:
+    import ahocorasick
+except ImportError:  # optional speed-up
+    ahocorasick = None
+
+from playwright.sync_api import (
+    sync_playwright,
+    BrowserContext,
+    Page,
+    Playwright,
+    TargetClosedError,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 from base_watcher import BaseWatcher
 
 logger = logging.getLogger(__name__)
 
+# Keyword groups — a match in _HIGH_PRIORITY raises the action file's
+# priority; the others pick the suggested actions
+_HIGH_PRIORITY = frozenset({"urgent", "asap"})
+_URGENT = frozenset({"urgent", "asap"})
+_PAYMENT = frozenset({"invoice", "payment"})
+_HELP = frozenset({"help", "quick", "now"})
+
+# _slugify() patterns: characters dropped, then runs folded into one "_"
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_COLLAPSE = re.compile(r"[\s_-]+")
+
+# WhatsApp marks unread chats with a span containing the unread count.
+# Multiple selectors for resilience across minor UI changes; the first
+# one that matches anything wins.
+UNREAD_SELECTORS = [
+    'span[data-testid="icon-unread-count"]',
+    'span[aria-label*="unread message"]',
+    'span[aria-label*="unread"]',
+]
+
+# Chromium switches for a long-running background scraper: Translate,
+# MediaRouter, optimization-hint downloads, background networking, component
+# updates, default apps, /dev/shm use, extensions, sync and the GPU are
+# turned off, and the navigator.webdriver automation flag is hidden.
+# The sandbox is deliberately left on — the page is a logged-in session
+# rendering content from the internet.
+CHROMIUM_ARGS = [
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-gpu",
+]
+
+# Resources the scraper never looks at — avatars, media, emoji sheets and
+# fonts — blocked at the network layer to keep the long-lived page light
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp",
+    "*.mp4", "*.webm", "*.ogg", "*.opus",
+    "*.woff", "*.woff2", "*.ttf",
+]
+
+# Runs in the page: finds the unread badges, takes each one's chat row with
+# closest() and reads the chat name and last-message preview — all in one call
+SCRAPE_UNREAD_JS = """selectors => {
+    let badges = [];
+    let selector = null;
+    for (const sel of selectors) {
+        badges = document.querySelectorAll(sel);
+        if (badges.length) { selector = sel; break; }
+    }
+
+    // Nearest enclosing chat row, found natively instead of stepping
+    // through parentElement in script
+    const ROW = '[data-testid="cell-frame-container"], [role="listitem"], [tabindex="-1"]';
+    const rowOf = el => el.parentElement && el.parentElement.closest(ROW);
+
+    const nameOf = el => {
+        const title = el.querySelector('[data-testid="cell-frame-title"]');
+        if (title) return title.innerText.trim();
+        const span = el.querySelector('span[dir="auto"][title]');
+        if (span) return span.getAttribute('title') || span.innerText.trim();
+        return 'Unknown';
+    };
+
+    const previewOf = el => {
+        const msg = el.querySelector('[data-testid="last-msg-status"]');
+        if (msg) return msg.innerText.trim();
+        const span2 = el.querySelector('span[data-testid="cell-frame-secondary"]');
+        if (span2) return span2.innerText.trim();
+        const spans = el.querySelectorAll('span[dir="ltr"], span[dir="auto"]');
+        for (const s of spans) {
+            if (s.innerText.length > 10) return s.innerText.trim();
+        }
+        return '';
+    };
+
+    // A row can carry more than one matching badge; read each row once
+    const seen = new Set();
+    const chats = [];
+    for (const badge of badges) {
+        try {
+            const row = rowOf(badge);
+            if (!row || seen.has(row)) continue;
+            seen.add(row);
+            chats.push({chat_name: nameOf(row), preview_text: previewOf(row)});
+        } catch (e) {
+            // Skip a row that changed under us; the rest are still read
+        }
+    }
+    return {
+        chat_list: !!document.querySelector('[data-testid="chat-list"]'),
+        selector: selector,
+        badges: badges.length,
+        chats: chats,
+    };
+}"""
+
+
+def _keyword_matcher(keywords: list[str]) -> Callable[[str], set[str]]:
+    """Build a function returning the set of *keywords* found in a text.
+
+    With pyahocorasick the keywords become one Aho–Corasick automaton, so
+    a text is scanned once in linear time however many keywords there are.
+    Otherwise they are compiled into one regex alternation — longest first,
+    so a keyword is never cut short by a shorter one sharing its prefix.
+    """
+    if not keywords:
+        return lambda text: set()
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return lambda text: {kw for _, kw in automaton.iter(text)}
+
+    alternatives = sorted(map(re.escape, keywords), key=len, reverse=True)
+    pattern = re.compile("|".join(alternatives))
+    return lambda text: set(pattern.findall(text))
+
 
 class WhatsAppWatcher(BaseWatcher):
     """Watch WhatsApp Web for unread messages containing urgent keywords."""
@@ -49,55 +189,111 @@ class WhatsAppWatcher(BaseWatcher):
         super().__init__(vault_path, check_interval)
 
         self.session_path = Path(session_path)
-        self.session_path.mkdir(parents=True, exist_ok=True)
+        # One stat for the usual case of an existing profile; mkdir with
+        # exist_ok would fail with EEXIST and then stat anyway
+        if not self.session_path.is_dir():
+            self.session_path.mkdir(parents=True, exist_ok=True)
         self.headless = headless
-        self.keywords = list(self.KEYWORDS)
+        self.keywords = self.KEYWORDS
+
+        # Browser kept alive between checks — started on the first check,
+        # torn down by close() or after the browser crashes
+        self._pw: Playwright | None = None
+        self._context: BrowserContext | None = None
+        self._page: Page | None = None
+
+    @property
+    def keywords(self) -> list[str]:
+        return self._keywords
+
+    @keywords.setter
+    def keywords(self, keywords: list[str]) -> None:
+        """Replace the keyword list and rebuild its matcher."""
+        self._keywords = list(keywords)
+        self._find_keywords = _keyword_matcher(self._keywords)
+        # First letters of the keywords in either case — a preview with
+        # none of them cannot match, so it skips lower() and the scan
+        self._first_chars = frozenset(
+            c for kw in self._keywords if kw for c in (kw[0], kw[0].upper())
+        )
 
     # ------------------------------------------------------------------
     # BaseWatcher interface
     # ------------------------------------------------------------------
 
     def check_for_updates(self) -> list:
-        """Launch a persistent browser context, scrape unread chats,
-        and return those whose preview text contains at least one keyword.
+        """Scrape unread chats from the long-lived WhatsApp Web page and
+        return those whose preview text contains at least one keyword.
+
+        WhatsApp Web keeps the chat list live over its websocket, so the
+        page is not reloaded between checks.
         """
         urgent_messages: list[dict] = []
 
         try:
-            with sync_playwright() as pw:
-                context = self._get_browser_context(pw)
-                try:
-                    page = self._open_whatsapp(context)
-                    if page is None:
-                        return []
+            page = self._ensure_page()
+            if page is None:
+                return []
 
-                    urgent_messages = self._scrape_unread_chats(page)
-                finally:
-                    context.close()
+            urgent_messages = self._scrape_unread_chats(page)
 
+        except TargetClosedError:
+            self.logger.warning("Browser closed unexpectedly — relaunching on next check")
+            self._close_browser()
         except Exception:
             self.logger.exception("Error during WhatsApp check")
 
         return urgent_messages
 
+    def close(self) -> None:
+        """Shut down the browser, then release the base watcher's resources."""
+        self._close_browser()
+        super().close()
+
     def create_action_file(self, item) -> Path:
         """Write an action markdown file for a single urgent WhatsApp message."""
+        now = datetime.datetime.now()
+        return self._write_action(item, now.isoformat(), now.strftime("%Y%m%d_%H%M%S"))
+
+    def _create_action_files(self, updates: list) -> None:
+        """Write a whole scan's action files with one clock read.
+
+        Each file is a single small write, so they are written in turn
+        rather than on a thread pool.  Within a batch the files share a
+        timestamp, so a counter keeps two messages from one chat apart.
+        """
+        now = datetime.datetime.now()
+        received = now.isoformat()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        numbered = len(updates) > 1
+        for i, item in enumerate(updates, 1):
+            try:
+                path = self._write_action(
+                    item, received, timestamp, f"_{i:02d}" if numbered else ""
+                )
+            except Exception:
+                self.logger.exception("Failed to create action file")
+                continue
+            self.logger.info("Created action file: %s", path.name)
+
+    def _write_action(
+        self, item: dict, received: str, timestamp: str, suffix: str = ""
+    ) -> Path:
+        """Build and write the action file for *item*, stamped with the
+        given ISO *received* time and filename *timestamp*."""
         chat_name: str = item.get("chat_name", "Unknown")
         text: str = item.get("text", "")
         matched: list[str] = item.get("matched_keywords", [])
-        received = datetime.datetime.now().isoformat()
 
         # Determine priority from keywords
-        high_priority_words = {"urgent", "asap"}
-        priority = "high" if high_priority_words & set(matched) else "medium"
+        priority = "medium" if _HIGH_PRIORITY.isdisjoint(matched) else "high"
 
         # Build suggested actions
         suggestions = self._suggest_actions(matched)
 
         # Slugify the chat name for the filename
         slug = self._slugify(chat_name)
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"WHATSAPP_{timestamp}_{slug}.md"
+        filename = f"WHATSAPP_{timestamp}_{slug}{suffix}.md"
 
         content = (
             f"---\n"
@@ -118,8 +314,7 @@ class WhatsAppWatcher(BaseWatcher):
             f"{suggestions}"
         )
 
-        filepath = self.needs_action / filename
-        filepath.write_text(content, encoding="utf-8")
+        filepath = self.write_action_file(filename, content)
         self.logger.info(
             "Action file created: %s (from: %s, priority: %s)",
             filename,
@@ -132,6 +327,45 @@ class WhatsAppWatcher(BaseWatcher):
     # Browser helpers
     # ------------------------------------------------------------------
 
+    def _ensure_page(self) -> Page | None:
+        """Return the open WhatsApp Web page, launching the browser and
+        loading the page only when there is none yet.
+
+        Returns None if WhatsApp Web did not load or is not logged in; the
+        browser stays up and the page is retried on the next check.
+        """
+        if self._page is not None and not self._page.is_closed():
+            return self._page
+
+        if self._context is None:
+            self._pw = sync_playwright().start()
+            try:
+                self._context = self._get_browser_context(self._pw)
+            except Exception:
+                # Chromium missing or the profile locked — stop the driver so
+                # the next check can start a fresh one
+                self._close_browser()
+                raise
+
+        self._page = self._open_whatsapp(self._context)
+        return self._page
+
+    def _close_browser(self) -> None:
+        """Close the browser context and stop Playwright, ignoring errors
+        from a browser that has already gone away."""
+        context, pw = self._context, self._pw
+        self._page = self._context = self._pw = None
+        if context is not None:
+            try:
+                context.close()
+            except Exception:
+                self.logger.debug("Browser context was already closed")
+        if pw is not None:
+            try:
+                pw.stop()
+            except Exception:
+                self.logger.debug("Playwright was already stopped")
+
     def _get_browser_context(self, pw) -> BrowserContext:
         """Return a persistent Chromium context that preserves the QR login."""
         self.logger.debug(
@@ -149,6 +383,7 @@ class WhatsAppWatcher(BaseWatcher):
             ),
             viewport={"width": 1280, "height": 900},
             locale="en-US",
+            args=CHROMIUM_ARGS,
         )
         return context
 
@@ -158,9 +393,15 @@ class WhatsAppWatcher(BaseWatcher):
         Returns the Page on success, or None if the user is not logged in.
         """
         page = context.new_page()
+        self._block_resources(page)
 
         self.logger.info("Navigating to WhatsApp Web")
-        page.goto("https://web.whatsapp.com", wait_until="domcontentloaded")
+        try:
+            page.goto("https://web.whatsapp.com", wait_until="domcontentloaded")
+        except Exception:
+            # Don't leave a dead tab behind in the long-lived context
+            page.close()
+            raise
 
         # Wait for either the chat list (logged in) or the QR canvas (not logged in)
         try:
@@ -173,6 +414,7 @@ class WhatsAppWatcher(BaseWatcher):
                 "WhatsApp Web did not load within 30 seconds — "
                 "check your network connection"
             )
+            page.close()
             return None
 
         # Check if we landed on the QR code screen instead of the chat list
@@ -187,118 +429,104 @@ class WhatsAppWatcher(BaseWatcher):
                 "Run once with headless=False:  "
                 "WhatsAppWatcher(vault, session, headless=False).run()"
             )
+            page.close()
             return None
 
-        # Give dynamic content a moment to populate
-        page.wait_for_timeout(3000)
+        # Wait for the first chat row rather than a fixed delay; a chat list
+        # that stays empty is legitimate, so a timeout is not an error
+        try:
+            page.wait_for_selector(
+                '[data-testid="cell-frame-container"]',
+                state="attached",
+                timeout=5_000,
+            )
+        except PlaywrightTimeoutError:
+            self.logger.debug("No chat rows appeared — chat list may be empty")
         self.logger.info("WhatsApp Web loaded — scanning unread chats")
         return page
 
+    def _block_resources(self, page: Page) -> None:
+        """Stop *page* from downloading BLOCKED_URL_PATTERNS.
+
+        Uses a CDP session rather than page.route(), which keeps a Python
+        round-trip per request and grows over a long-running session.
+        Blocking is an optimisation only — on failure the page loads
+        everything as before.
+        """
+        try:
+            cdp = page.context.new_cdp_session(page)
+            cdp.send("Network.enable")
+            cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception:
+            self.logger.debug("Could not enable resource blocking", exc_info=True)
+
     def _scrape_unread_chats(self, page: Page) -> list[dict]:
-        """Find all unread chat rows and check their preview text for keywords."""
+        """Find all unread chat rows and check their preview text for keywords.
+
+        Every row is located and read inside the page by a single evaluate()
+        call, so the scan costs one round-trip however many chats are unread.
+        The same call reports whether the chat list is still showing.
+        """
         urgent: list[dict] = []
 
-        # WhatsApp marks unread chats with a span containing the unread count.
-        # Multiple selectors for resilience across minor UI changes.
-        unread_selectors = [
-            'span[data-testid="icon-unread-count"]',
-            'span[aria-label*="unread message"]',
-            'span[aria-label*="unread"]',
-        ]
-
-        unread_badges = []
-        for selector in unread_selectors:
-            unread_badges = page.query_selector_all(selector)
-            if unread_badges:
-                self.logger.debug(
-                    "Found %d unread badge(s) with selector: %s",
-                    len(unread_badges),
-                    selector,
-                )
-                break
+        scan = page.evaluate(SCRAPE_UNREAD_JS, UNREAD_SELECTORS)
+
+        # The page is only (re)loaded when the chat list has gone — logged
+        # out, or WhatsApp Web dropped back to its loading screen.  Closing
+        # it makes the next check load it afresh.
+        if not scan["chat_list"]:
+            self.logger.warning("WhatsApp Web chat list is gone — reloading on next check")
+            page.close()
+            return []
 
-        if not unread_badges:
+        if scan["selector"] is None:
             self.logger.debug("No unread chat badges found")
             return []
 
-        for badge in unread_badges:
-            try:
-                # Walk up from the badge to the chat row container
-                chat_row = badge.evaluate_handle(
-                    """el => {
-                        let node = el;
-                        for (let i = 0; i < 10; i++) {
-                            node = node.parentElement;
-                            if (!node) return null;
-                            if (node.getAttribute('data-testid') === 'cell-frame-container'
-                                || node.getAttribute('role') === 'listitem'
-                                || node.getAttribute('tabindex') === '-1') {
-                                return node;
-                            }
-                        }
-                        return node;
-                    }"""
-                )
+        self.logger.debug(
+            "Found %d unread badge(s) with selector: %s",
+            scan["badges"],
+            scan["selector"],
+        )
 
-                if not chat_row:
-                    continue
-
-                # Extract chat name
-                chat_name = chat_row.evaluate(
-                    """el => {
-                        const title = el.querySelector('[data-testid="cell-frame-title"]');
-                        if (title) return title.innerText.trim();
-                        const span = el.querySelector('span[dir="auto"][title]');
-                        if (span) return span.getAttribute('title') || span.innerText.trim();
-                        return 'Unknown';
-                    }"""
-                )
+        # Checked once, not per chat inside the loop
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-                # Extract last message preview
-                preview_text = chat_row.evaluate(
-                    """el => {
-                        const msg = el.querySelector('[data-testid="last-msg-status"]');
-                        if (msg) return msg.innerText.trim();
-                        const span2 = el.querySelector('span[data-testid="cell-frame-secondary"]');
-                        if (span2) return span2.innerText.trim();
-                        const spans = el.querySelectorAll('span[dir="ltr"], span[dir="auto"]');
-                        for (const s of spans) {
-                            if (s.innerText.length > 10) return s.innerText.trim();
-                        }
-                        return '';
-                    }"""
-                )
+        for chat in scan["chats"]:
+            chat_name = chat["chat_name"]
+            preview_text = chat["preview_text"]
 
-                if not preview_text:
+            if not preview_text:
+                if debug:
                     self.logger.debug("No preview text for chat: %s", chat_name)
-                    continue
-
-                # Check for keyword matches
-                text_lower = preview_text.lower()
-                matched = [kw for kw in self.keywords if kw in text_lower]
-
-                if matched:
-                    self.logger.info(
-                        "Keyword match in chat '%s': %s",
-                        chat_name,
-                        ", ".join(matched),
-                    )
-                    urgent.append(
-                        {
-                            "chat_name": chat_name,
-                            "text": preview_text,
-                            "matched_keywords": matched,
-                        }
-                    )
+                continue
 
-            except Exception:
-                self.logger.exception("Error processing an unread chat badge")
+            if self._first_chars.isdisjoint(preview_text):
                 continue
 
+            # Check for keyword matches — one scan, reported in
+            # keyword-list order
+            found = self._find_keywords(preview_text.lower())
+            matched = [kw for kw in self.keywords if kw in found]
+
+            if matched:
+                self.logger.info(
+                    "Keyword match in chat '%s': %s",
+                    chat_name,
+                    ", ".join(matched),
+                )
+                urgent.append(
+                    {
+                        "chat_name": chat_name,
+                        "text": preview_text,
+                        "matched_keywords": matched,
+                    }
+                )
+
         self.logger.info(
             "Scan complete — %d urgent message(s) found out of %d unread",
             len(urgent),
-            len(unread_badges),
+            len(scan["chats"]),
         )
         return urgent
 
@@ -307,34 +535,48 @@ class WhatsAppWatcher(BaseWatcher):
     # ------------------------------------------------------------------
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _slugify(text: str) -> str:
-        """Convert text to a safe filename slug."""
+        """Convert text to a safe filename slug (cached — the same chats
+        write action files again and again)."""
         text = text.lower().strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[\s_-]+", "_", text)
+        # Common case — plain words separated by spaces ("John Doe"): nothing
+        # to strip, so joining the words gives the slug without any regex
+        words = text.split()
+        if all(map(str.isalnum, words)):
+            return "_".join(words)[:50] or "unknown"
+        text = _SLUG_STRIP.sub("", text)
+        text = _SLUG_COLLAPSE.sub("_", text)
         return text[:50] or "unknown"
 
     @staticmethod
     def _suggest_actions(matched_keywords: list[str]) -> str:
         """Build a markdown checklist of suggested actions based on matched keywords."""
-        actions: list[str] = []
-
-        payment_words = {"invoice", "payment"}
-        urgent_words = {"urgent", "asap"}
-        help_words = {"help", "quick", "now"}
+        # isdisjoint() tests the list against each frozenset directly,
+        # without building a set of the matches first
+        return WhatsAppWatcher._checklist(
+            not _URGENT.isdisjoint(matched_keywords),
+            not _PAYMENT.isdisjoint(matched_keywords),
+            not _HELP.isdisjoint(matched_keywords),
+        )
 
-        matched_set = set(matched_keywords)
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _checklist(urgent: bool, payment: bool, help_: bool) -> str:
+        """The checklist for one combination of matched keyword groups —
+        there are only eight, so each is built once and then reused."""
+        actions: list[str] = []
 
-        if matched_set & urgent_words:
+        if urgent:
             actions.append("- [ ] **URGENT** — Escalate and respond immediately")
 
-        if matched_set & payment_words:
+        if payment:
             actions.append(
                 "- [ ] Create `Pending_Approval/` file for payment review"
             )
             actions.append("- [ ] Verify invoice details and amount")
 
-        if matched_set & help_words:
+        if help_:
             actions.append("- [ ] Assess request and provide assistance")
 
         # Always-present actions